@@ -6,16 +6,148 @@ according to the operating system.
 
 import os
 import glob
+import string
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from common import constants
 from common.utility import adjust_path_for_os
 
+# Module-local bindings of the constants used on the per-asset-class hot path
+_MSA = constants.ASSET_CLASS_MSA_TMS_CODES
+_COLLATERAL = constants.COLLATERAL
+_DERIVONE_GLOB_KEYS = (constants.EQUITY_DERIVATIVES, constants.EQUITY_SWAPS)
+
+
+# Characters which make a pattern more than a plain '*' wildcard and require fnmatch semantics
+GLOB_SPECIAL_CHARS = ('?', '[', '{')
+
+
+def _matches_wildcard(name, fragments):
+    """
+    Checks whether the file name matches the literal fragments of a '*'-only pattern, in order.
+    """
+    if len(fragments) == 1:
+        return name == fragments[0]
+
+    prefix, suffix = fragments[0], fragments[-1]
+    if len(name) < len(prefix) + len(suffix) or not name.startswith(prefix) or not name.endswith(suffix):
+        return False
+
+    # Middle fragments must appear left-to-right between the prefix and the suffix
+    cursor, end = len(prefix), len(name) - len(suffix)
+    for fragment in fragments[1:-1]:
+        position = name.find(fragment, cursor, end)
+        if position < 0:
+            return False
+        cursor = position + len(fragment)
+    return True
+
+
+def match_files(dir_path, file_pattern):
+    """
+    Finds the files in a single directory matching a file name pattern.
+
+    Patterns containing only '*' wildcards are matched with plain string operations over one
+    directory listing; anything else falls back to glob.
+
+    Parameters:
+    dir_path (str): The directory to search.
+    file_pattern (str): The file name pattern (no directory component).
+
+    Returns:
+    list: List of matching file paths.
+    """
+    return match_files_many(dir_path, [file_pattern])[0]
+
+
+def match_files_many(dir_path, file_patterns):
+    """
+    Finds the files in a single directory matching each of several file name patterns,
+    scanning the directory only once for all the '*'-only patterns.
+
+    Parameters:
+    dir_path (str): The directory to search.
+    file_patterns (list): The file name patterns (no directory component).
+
+    Returns:
+    list: One list of matching file paths per pattern, in the order of file_patterns.
+    """
+    results = [None] * len(file_patterns)
+    wildcard_patterns = []
+    for i, file_pattern in enumerate(file_patterns):
+        if any(char in file_pattern for char in GLOB_SPECIAL_CHARS):
+            results[i] = glob.glob(os.path.join(dir_path, file_pattern))
+        else:
+            # Mirror glob: case-insensitive on Windows and hidden files only matched by an explicit leading '.'
+            wildcard_patterns.append((i, os.path.normcase(file_pattern).split('*'), file_pattern.startswith('.')))
+
+    if wildcard_patterns:
+        with os.scandir(dir_path) as entries:
+            entries = [(entry.path, os.path.normcase(entry.name)) for entry in entries]
+
+        for i, fragments, include_hidden in wildcard_patterns:
+            results[i] = [
+                path for path, name in entries
+                if (include_hidden or not name.startswith('.')) and _matches_wildcard(name, fragments)
+            ]
+
+    return results
+
+
+def compile_file_pattern(template):
+    """
+    Pre-parses a str.format file name template into a function rendering it from keyword arguments,
+    so the template isn't re-parsed on every call.
+
+    Parameters:
+    template (str): The file name template.
+
+    Returns:
+    callable: Function taking the template fields as keyword arguments and returning the file pattern.
+    """
+    parts = list(string.Formatter().parse(template))
+
+    # Conversions and format specs aren't used by the file templates; let str.format handle them if present
+    if any(conversion or format_spec for _, _, format_spec, conversion in parts):
+        return template.format
+
+    parts = [(literal, field_name) for literal, field_name, _, _ in parts]
+
+    def render(**fields):
+        return ''.join(
+            literal if field_name is None else literal + str(fields[field_name])
+            for literal, field_name in parts
+        )
+
+    return render
+
+
+def list_directory(dir_path):
+    """
+    Lists a directory once, returning its entries keyed by (OS-normalised) name.
+
+    Parameters:
+    dir_path (str): The directory to list.
+
+    Returns:
+    dict: Dictionary mapping entry names to os.DirEntry objects; empty if the directory is missing.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return {os.path.normcase(entry.name): entry for entry in entries}
+    except OSError:
+        return {}
+
 
 class FilePathConfig:
     """
     A class to configure and retrieve file paths for TSR and DerivOne files.
     """
 
+    # Upper bound on concurrent file lookups against the (network) file system
+    MAX_IO_WORKERS = 8
+
     # Regimes and their respective configurations
     REGIMES_CONFIG = {
         constants.EMIR_REFIT: {
@@ -50,6 +182,30 @@ class FilePathConfig:
         },
     }
 
+    # DerivOne file path templates per asset class
+    DERIVONE_PATH_TEMPLATES = {
+        constants.COMMODITY: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/CO/imrecon_com_eod_prod_{report_date_yymmdd}.csv'],
+
+        constants.CREDIT: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/CR/imrecon_crd_ny_eod_CR_prod_{report_date_yymmdd}.csv',
+                           r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/CR/imrecon_crd_ln_eod_CR_prod_{report_date_yymmdd}.csv',
+                           r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/CR/imrecon_crd_ap_eod_CR_prod_{report_date_yymmdd}.csv'],
+
+        constants.EQUITY_DERIVATIVES: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/GINGER/EQD/dfa_eq_ds_prod_{report_date_yy_mm_dd}_*.csv',
+                                       r'/v/region/eu/appl/gtr/traq/data/{env}/input/GINGER/EQD/dfa_eq_ex_prod_{report_date_yy_mm_dd}_*.csv',
+                                       r'/v/region/eu/appl/gtr/traq/data/{env}/input/GINGER/EQD/dfa_eq_op_prod_{report_date_yy_mm_dd}_*.csv',
+                                       r'/v/region/eu/appl/gtr/traq/data/{env}/input/GINGER/EQD/dfa_eq_vs_prod_{report_date_yy_mm_dd}_*.csv'],
+
+        constants.EQUITY_SWAPS: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_ny.csv',
+                                 r'/v/region/eu/appl/gtr/traq/data/{env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_ln.csv',
+                                 r'/v/region/eu/appl/gtr/traq/data/{env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_hk.csv'],
+
+        constants.FOREIGN_EXCHANGE: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/FX/imrecon_fx_eod_prod_{report_date_yymmdd}.csv'],
+
+        constants.INTEREST_RATES: [r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/IR/imrecon_ird_ny_eod_prod_{report_date_yymmdd}.csv',
+                                   r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/IR/imrecon_ird_ln_eod_prod_{report_date_yymmdd}.csv',
+                                   r'/v/region/eu/appl/gtr/traq/data/{env}/input/Deriv1/IR/imrecon_ird_ap_eod_prod_{report_date_yymmdd}.csv'],
+    }
+
     def __init__(self, run_date, env, logger_obj=None):
         """
         Initializes the FilePathConfig with the provided run date.
@@ -70,7 +226,26 @@ class FilePathConfig:
         self.tsr_base_directory = adjust_path_for_os(self.tsr_base_directory)
         self.collateral_base_directory = adjust_path_for_os(self.collateral_base_directory)
 
+        # Regime directories resolved for the operating system once, instead of per asset class
+        self._tsr_regime_dirs = {
+            regime: adjust_path_for_os(os.path.join(self.tsr_base_directory, regime)) for regime in self.REGIMES_CONFIG
+        }
+        self._collateral_dirs = {
+            regime: adjust_path_for_os(os.path.join(self.collateral_base_directory, regime))
+            for regime in self.REGIMES_CONFIG
+        }
+
+        # DerivOne path templates with the environment bound and adjusted for the operating system
+        self._derivone_path_templates = {
+            asset_class: [adjust_path_for_os(template.replace('{env}', self.env)) for template in templates]
+            for asset_class, templates in self.DERIVONE_PATH_TEMPLATES.items()
+        }
+
+        # Per-regime subfolder/prefix/pattern plans, so lookups don't re-resolve REGIMES_CONFIG per asset class
+        self._regime_plans = self._build_regime_plans()
+
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def report_date_to_filename(report_date, date_format):
         """
         Converts report date from 'YYYY-MM-DD' to the specified date format.
@@ -87,23 +262,27 @@ class FilePathConfig:
         dt = datetime.strptime(report_date, '%Y-%m-%d')
         return dt.strftime(date_format)
 
-    def construct_file_pattern(self, template, report_date, date_format, asset_class, msa_tms_code, prefix=''):
+    def construct_file_pattern(self, template, report_date, date_format, asset_class, msa_tms_code, prefix='',
+                               date_part=None):
         """
         Constructs the file pattern by formatting the template with the provided variables.
 
         Parameters:
-        template (str): The file name template.
+        template (str or callable): The file name template, or its compiled form from compile_file_pattern.
         report_date (str): The report date in 'YYYY-MM-DD' format.
         date_format (str): The date format to use in the filename.
         asset_class (str): The asset class code.
         msa_tms_code (str): The MSA code for the asset class.
         prefix (str): The prefix to use in the filename (if applicable).
+        date_part (str): The report date already converted to date_format; derived when not given.
 
         Returns:
         str: The constructed file pattern.
         """
-        date_part = self.report_date_to_filename(report_date, date_format)
-        file_pattern = template.format(
+        if date_part is None:
+            date_part = self.report_date_to_filename(report_date, date_format)
+        render = template if callable(template) else template.format
+        file_pattern = render(
             prefix=prefix,
             report_date=report_date,
             msa_tms_code=msa_tms_code,
@@ -123,18 +302,15 @@ class FilePathConfig:
         report_date (str): The report date in 'YYYY-MM-DD' format. Defaults to self.run_date.
 
         Returns:
-        dict: Dictionary mapping asset classes to lists of matching file paths.
+        dict: Dictionary mapping asset classes to tuples of matching file paths.
         """
         if report_date is None:
             report_date = self.run_date
 
-        # Convert asset_classes to a list if it's a string
-        if isinstance(asset_classes, str):
-            asset_classes = [asset_classes]
-
-        # Handle 'EQD' and 'EQS' as 'EQ' when fetching the file paths
-        original_asset_classes = asset_classes.copy()  # Keep a copy to use in the final return
-        asset_classes = ['EQ' if asset_class in ['EQD', 'EQS'] else asset_class for asset_class in asset_classes]
+        # Normalize asset_classes to a tuple once, handling 'EQD' and 'EQS' as 'EQ' when fetching the file paths
+        original_asset_classes = (asset_classes,) if isinstance(asset_classes, str) else tuple(asset_classes)
+        asset_classes = tuple('EQ' if asset_class in ('EQD', 'EQS') else asset_class
+                              for asset_class in original_asset_classes)
 
         # Get the regime configuration
         regime_info = self.REGIMES_CONFIG.get(regime)
@@ -145,21 +321,38 @@ class FilePathConfig:
 
         files_found = {}
 
+        # Listings of the regime (and subfolder) roots, shared by all asset classes in this call
+        dir_listings = {}
+
         try:
-            # Process subfolders or top-level directory for asset classes
-            if regime_info.get('subfolders'):
-                # Handle subfolders (like EMIR_REFIT's ESMA and FCA)
-                self._process_subfolders(regime_info, regime, asset_classes, report_date, files_found)
-            else:
-                # Handle top-level asset classes
-                self._process_asset_classes(regime_info, regime, asset_classes, report_date, files_found)
-
-            # Add EQD and EQS to the final return dictionary, with unique lists instead of referencing EQ
+            # Process subfolders (like EMIR_REFIT's ESMA and FCA) or top-level directory for asset classes
+            # The filename date part only depends on the regime, so derive it once for all asset classes
+            date_part = self.report_date_to_filename(report_date, regime_info.get('date_format'))
+            tasks = self._process_regime_plan(regime_info, regime, asset_classes, report_date, date_part,
+                                              dir_listings)
+
+            # The lookups are independent and I/O-latency bound, so run them concurrently
+            with ThreadPoolExecutor(max_workers=self.MAX_IO_WORKERS) as executor:
+                futures = [executor.submit(task) for task in tasks]
+
+                # Merge the results in submission order to keep the file order deterministic
+                for future in futures:
+                    result = future.result()
+                    if result is None:
+                        continue
+                    asset_class, matching_files = result
+                    if asset_class not in files_found:
+                        files_found[asset_class] = []
+                    files_found[asset_class].extend(matching_files)
+
+            # Freeze the results so that the same file sequence can be shared safely between asset classes
+            files_found = {asset_class: tuple(matching_files) for asset_class, matching_files in files_found.items()}
+
+            # Add EQD and EQS to the final return dictionary, aliasing the immutable EQ result
             if 'EQ' in files_found:
                 for asset_class in original_asset_classes:
-                    if asset_class in ['EQD', 'EQS']:
-                        # Create a copy of the list instead of assigning directly
-                        files_found[asset_class] = list(files_found['EQ'])
+                    if asset_class in ('EQD', 'EQS'):
+                        files_found[asset_class] = files_found['EQ']
 
         except Exception as e:
             # print(f"Error occurred while processing TSR files for regime {regime}: {str(e)}")
@@ -167,103 +360,120 @@ class FilePathConfig:
 
         return files_found
 
-    def _process_subfolders(self, regime_info, regime, asset_classes, report_date, files_found):
+    def _build_regime_plans(self):
         """
-        Process asset classes for regimes with subfolders.
+        Precompute, per regime, the (subfolder, file pattern builder) entries to iterate over.
+        Regimes without subfolders get a single entry for the top-level directory.
         """
-        subfolders = regime_info.get('subfolders')
-        for subfolder in subfolders:
-            prefix = regime_info.get('prefixes', {}).get(subfolder, '')
-
+        regime_plans = {}
+        for regime, regime_info in self.REGIMES_CONFIG.items():
+            prefixes = regime_info.get('prefixes', {})
+            plan = []
+            for subfolder in regime_info.get('subfolders') or [None]:
+                pattern_builder = functools.partial(
+                    self.construct_file_pattern,
+                    regime_info['tsr_file_pattern_fn'],
+                    date_format=regime_info.get('date_format'),
+                    prefix=prefixes.get(subfolder, '')
+                )
+                plan.append((subfolder, pattern_builder))
+            regime_plans[regime] = plan
+        return regime_plans
+
+    def _process_regime_plan(self, regime_info, regime, asset_classes, report_date, date_part, dir_listings):
+        """
+        Build the fetch tasks for every subfolder (or the top-level directory) and asset class of a regime.
+        """
+        tasks = []
+        for subfolder, pattern_builder in self._regime_plans[regime]:
             for asset_class in asset_classes:
-                if asset_class.upper() == 'COL':
-                    self._fetch_collateral_files(regime_info, regime, subfolder, asset_class, report_date, files_found)
+                if asset_class.upper() == _COLLATERAL:
+                    tasks.append(functools.partial(self._fetch_collateral_files, regime_info, regime, subfolder,
+                                                   asset_class, report_date))
                 else:
-                    self._fetch_tsr_files(regime_info, regime, subfolder, asset_class, report_date, prefix, files_found)
+                    self._list_tsr_root(regime, subfolder, dir_listings)
+                    tasks.append(functools.partial(self._fetch_tsr_files, pattern_builder, regime, subfolder,
+                                                   asset_class, report_date, date_part, dir_listings))
+        return tasks
 
-    def _process_asset_classes(self, regime_info, regime, asset_classes, report_date, files_found):
+    def _list_tsr_root(self, regime, subfolder, dir_listings):
         """
-        Process asset classes for regimes without subfolders.
+        List the regime/subfolder root once per call, before the fetch tasks are dispatched.
         """
-        for asset_class in asset_classes:
-            if asset_class.upper() == constants.COLLATERAL:
-                self._fetch_collateral_files(regime_info, regime, None, asset_class, report_date, files_found)
-            else:
-                self._fetch_tsr_files(regime_info, regime, None, asset_class, report_date, '', files_found)
+        root_key = (regime, subfolder)
+        if root_key not in dir_listings:
+            root_path = os.path.join(self._tsr_regime_dirs[regime], subfolder or '')
+            dir_listings[root_key] = list_directory(root_path)
 
-    def _fetch_tsr_files(self, regime_info, regime, subfolder, asset_class, report_date, prefix, files_found):
+    def _fetch_tsr_files(self, pattern_builder, regime, subfolder, asset_class, report_date, date_part, dir_listings):
         """
         Fetch TSR files for a given asset class and subfolder.
+
+        pattern_builder is the regime plan's construct_file_pattern partial for this subfolder.
+
+        dir_listings caches the listing of each (regime, subfolder) root so that the asset class
+        directories are resolved from one scan instead of a stat per asset class.
+
+        Returns:
+        tuple: (asset_class, matching file paths), or None if the asset class can't be processed.
         """
         msa_tms_code = None
-        if asset_class not in [constants.COLLATERAL]:
-            msa_tms_code = constants.ASSET_CLASS_MSA_TMS_CODES.get(asset_class)
+        if asset_class != _COLLATERAL:
+            msa_tms_code = _MSA.get(asset_class)
             if msa_tms_code is None:
                 # print(f"Asset class '{asset_class}' not found in MSA configuration.")
                 self.logger.exception(f"Asset class '{asset_class}' not found in MSA configuration.")
-                return
-
-        # Construct the directory path
-        dir_path = os.path.join(self.tsr_base_directory, regime, subfolder or '', asset_class)
-        dir_path = adjust_path_for_os(dir_path)
+                return None
 
         # Check if the directory exists
-        if not os.path.exists(dir_path):
+        entry = dir_listings[(regime, subfolder)].get(os.path.normcase(asset_class))
+        if entry is None or not entry.is_dir():
+            dir_path = os.path.join(self._tsr_regime_dirs[regime], subfolder or '', asset_class)
             # print(f"Directory does not exist: {dir_path}")
             self.logger.exception(f"Directory does not exist: {dir_path}")
-            return
+            return None
+        dir_path = entry.path
 
         # Construct the file pattern
-        file_pattern = self.construct_file_pattern(
-            regime_info['tsr_file_pattern'],
-            report_date,
-            regime_info.get('date_format'),
-            asset_class,
-            msa_tms_code,
-            prefix
-        )
-
-        # Construct the full glob pattern
-        full_glob_pattern = os.path.join(dir_path, file_pattern)
+        file_pattern = pattern_builder(report_date=report_date, asset_class=asset_class, msa_tms_code=msa_tms_code,
+                                       date_part=date_part)
 
         # Find matching files
-        matching_files = glob.glob(full_glob_pattern)
+        matching_files = match_files(dir_path, file_pattern)
 
-        # Save the matching files
-        if asset_class not in files_found:
-            files_found[asset_class] = []
-        files_found[asset_class].extend(matching_files)
+        return asset_class, matching_files
 
-    def _fetch_collateral_files(self, regime_info, regime, subfolder, asset_class, report_date, files_found):
+    def _fetch_collateral_files(self, regime_info, regime, subfolder, asset_class, report_date):
         """
         Fetch collateral files for a given regime.
-        """
-        dir_path = os.path.join(self.collateral_base_directory, regime)
-        dir_path = adjust_path_for_os(dir_path)
 
-        # Check if the directory exists
-        if not os.path.exists(dir_path):
-            # print(f"Directory does not exist: {dir_path}")
-            self.logger.exception(f"Directory does not exist: {dir_path}")
-            return
+        Returns:
+        tuple: (asset_class, matching file paths), or None if the collateral files can't be looked up.
+        """
+        dir_path = self._collateral_dirs[regime]
 
         # Construct the file pattern for collateral files
         collateral_file_pattern = regime_info.get('collateral_file_pattern')
         if not collateral_file_pattern:
             # print(f"No collateral file pattern found for regime '{regime}'.")
             self.logger.exception(f"No collateral file pattern found for regime '{regime}'.")
-            return
+            return None
 
         file_pattern = collateral_file_pattern.format(report_date=report_date)
-        full_glob_pattern = os.path.join(dir_path, file_pattern)
 
-        # Find matching files
-        matching_files = glob.glob(full_glob_pattern)
+        # Find matching files; a missing directory surfaces from the scan itself instead of a prior exists check
+        try:
+            matching_files = match_files(dir_path, file_pattern)
+        except (FileNotFoundError, NotADirectoryError):
+            matching_files = None
 
-        # Save the matching files
-        if asset_class not in files_found:
-            files_found[asset_class] = []
-        files_found[asset_class].extend(matching_files)
+        # glob returns [] silently for a missing directory, so only check the directory when nothing matched
+        if matching_files is None or (not matching_files and not os.path.isdir(dir_path)):
+            # print(f"Directory does not exist: {dir_path}")
+            self.logger.exception(f"Directory does not exist: {dir_path}")
+            return None
+
+        return asset_class, matching_files
 
     def get_derivone_filepaths(self, report_date):
         """
@@ -280,35 +490,35 @@ class FilePathConfig:
 
         try:
             derivone_filepaths = {
-                constants.COMMODITY: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/CO/imrecon_com_eod_prod_{report_date_yymmdd}.csv")],
-
-                constants.CREDIT: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/CR/imrecon_crd_ny_eod_CR_prod_{report_date_yymmdd}.csv"),
-                                   adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/CR/imrecon_crd_ln_eod_CR_prod_{report_date_yymmdd}.csv"),
-                                   adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/CR/imrecon_crd_ap_eod_CR_prod_{report_date_yymmdd}.csv")],
-
-                constants.EQUITY_DERIVATIVES: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/GINGER/EQD/dfa_eq_ds_prod_{report_date_yy_mm_dd}_*.csv"),
-                                               adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/GINGER/EQD/dfa_eq_ex_prod_{report_date_yy_mm_dd}_*.csv"),
-                                               adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/GINGER/EQD/dfa_eq_op_prod_{report_date_yy_mm_dd}_*.csv"),
-                                               adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/GINGER/EQD/dfa_eq_vs_prod_{report_date_yy_mm_dd}_*.csv")],
-
-                constants.EQUITY_SWAPS: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_ny.csv"),
-                                         adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_ln.csv"),
-                                         adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/FRED/EQS/dfa_eq_es_prod_{report_date_yy_mm_dd}_*_hk.csv")],
-
-                constants.FOREIGN_EXCHANGE: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/FX/imrecon_fx_eod_prod_{report_date_yymmdd}.csv")],
-
-                constants.INTEREST_RATES: [adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/IR/imrecon_ird_ny_eod_prod_{report_date_yymmdd}.csv"),
-                                           adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/IR/imrecon_ird_ln_eod_prod_{report_date_yymmdd}.csv"),
-                                           adjust_path_for_os(rf"/v/region/eu/appl/gtr/traq/data/{self.env}/input/Deriv1/IR/imrecon_ird_ap_eod_prod_{report_date_yymmdd}.csv")]
+                asset_class: [
+                    template.format(report_date_yymmdd=report_date_yymmdd, report_date_yy_mm_dd=report_date_yy_mm_dd)
+                    for template in templates
+                ]
+                for asset_class, templates in self._derivone_path_templates.items()
             }
 
-            # Apply globbing for EQD and EQS file paths
-            for key in [constants.EQUITY_DERIVATIVES, constants.EQUITY_SWAPS]:
-                file_paths = []
-                for path_pattern in derivone_filepaths[key]:
-                    matched_files = glob.glob(path_pattern)
-                    file_paths.extend(matched_files)
-                derivone_filepaths[key] = file_paths
+            # Resolve the EQD and EQS path patterns with one scan per directory, the directories concurrently
+            with ThreadPoolExecutor(max_workers=self.MAX_IO_WORKERS) as executor:
+                futures = {}
+                for key in _DERIVONE_GLOB_KEYS:
+                    patterns_by_dir = {}
+                    for path_pattern in derivone_filepaths[key]:
+                        patterns_by_dir.setdefault(os.path.dirname(path_pattern), []).append(path_pattern)
+                    futures[key] = [
+                        (path_patterns, executor.submit(self._match_derivone_files, dir_path,
+                                                        [os.path.basename(path) for path in path_patterns]))
+                        for dir_path, path_patterns in patterns_by_dir.items()
+                    ]
+
+                for key, key_futures in futures.items():
+                    # Reassemble the matches in the original pattern order
+                    matches_by_pattern = {}
+                    for path_patterns, future in key_futures:
+                        matches_by_pattern.update(zip(path_patterns, future.result()))
+                    file_paths = []
+                    for path_pattern in derivone_filepaths[key]:
+                        file_paths.extend(matches_by_pattern[path_pattern])
+                    derivone_filepaths[key] = file_paths
 
             return derivone_filepaths
 
@@ -316,3 +526,18 @@ class FilePathConfig:
             # print(f"Error occurred while getting DerivOne file paths: {e}")
             self.logger.exception(f"Error occurred while getting DerivOne file paths: {e}")
             raise
+
+    @staticmethod
+    def _match_derivone_files(dir_path, file_patterns):
+        """
+        Match the DerivOne file patterns of one directory. Like glob, a missing directory yields no files.
+        """
+        try:
+            return match_files_many(dir_path, file_patterns)
+        except (FileNotFoundError, NotADirectoryError):
+            return [[] for _ in file_patterns]
+
+
+# Compile the TSR file templates once at import time, alongside the raw templates
+for _regime_info in FilePathConfig.REGIMES_CONFIG.values():
+    _regime_info['tsr_file_pattern_fn'] = compile_file_pattern(_regime_info['tsr_file_pattern'])
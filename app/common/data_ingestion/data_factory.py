@@ -1,6 +1,7 @@
 """
 Factory class to instantiate and return the appropriate data reader object.
 """
+import functools
 
 from common.data_ingestion.data_reader import DerivOneDataReader
 from common.data_ingestion.data_reader import TSRDataReader
@@ -8,19 +9,61 @@ from common.data_ingestion.data_reader import MSRDataReader
 from common.data_ingestion.data_reader import GLEIFDataReader
 
 
+@functools.lru_cache(maxsize=64)
+def _cached_reader(report_type, skiprow, skipfooter, asset_class, dtype_key, regime):
+    """
+    Instantiates the data reader for a parameter tuple once and reuses it for repeated requests.
+    The logger is not part of the cache key; it is injected by the caller after retrieval.
+
+    Parameters:
+    report_type (str): Lower-cased report type.
+    skiprow (int): Number of rows to skip at the start of the file.
+    skipfooter (int): Number of rows to skip at the end of the file.
+    asset_class (str): Asset class.
+    dtype_key (tuple): (True, sorted (column, dtype) pairs) for a dtype mapping, else (False, dtype).
+    regime (str): Regulatory regime.
+
+    Returns:
+    DataReader: The data reader instance.
+    """
+    is_mapping, dtype = dtype_key
+    if is_mapping:
+        dtype = dict(dtype)
+    if report_type == 'derivone':
+        return DerivOneDataReader(skiprow, skipfooter, report_type, asset_class, dtype)
+    elif report_type == 'tsr':
+        return TSRDataReader(skiprow, skipfooter, report_type, asset_class, dtype, regime)
+    elif report_type == 'msr':
+        return MSRDataReader(skiprow, skipfooter, report_type, asset_class, dtype, regime)
+    elif report_type == 'gleif':
+        return GLEIFDataReader(skiprow, skipfooter, report_type, asset_class, dtype)
+    else:
+        raise ValueError(f"Invalid report type: {report_type}. Must be one of 'DerivOne', 'TSR', 'GLEIF'.")
+
+
 class DataFactory:
+    # Report types whose readers log through the caller's logger
+    LOGGING_REPORT_TYPES = ('tsr', 'msr')
+
     @staticmethod
     def get_data_reader(skiprow, skipfooter, report_type, asset_class=None, dtype=None, regime=None, logger=None):
         """
         Factory method to instantiate and return the appropriate data reader object.
+        Readers are cached per (report_type, skiprow, skipfooter, asset_class, dtype, regime).
         """
-        if report_type.lower() == 'derivone':
-            return DerivOneDataReader(skiprow, skipfooter, report_type, asset_class, dtype)
-        elif report_type.lower() == 'tsr':
-            return TSRDataReader(skiprow, skipfooter, report_type, asset_class, dtype, regime, logger)
-        elif report_type.lower() == 'msr':
-            return MSRDataReader(skiprow, skipfooter, report_type, asset_class, dtype, regime, logger)
-        elif report_type.lower() == 'gleif':
-            return GLEIFDataReader(skiprow, skipfooter, report_type, asset_class, dtype)
+        report_type = report_type.lower()
+        # dtype is either a column mapping or a single dtype (e.g. str) applied to every column
+        if isinstance(dtype, dict):
+            dtype_key = (True, tuple(sorted(dtype.items())))
         else:
-            raise ValueError(f"Invalid report type: {report_type}. Must be one of 'DerivOne', 'TSR', 'GLEIF'.")
+            dtype_key = (False, dtype)
+        try:
+            data_reader = _cached_reader(report_type, skiprow, skipfooter, asset_class, dtype_key, regime)
+        except TypeError:
+            # Unhashable parameters (e.g. a dtype mapping with unhashable values) can't be cached
+            data_reader = _cached_reader.__wrapped__(report_type, skiprow, skipfooter, asset_class, dtype_key,
+                                                     regime)
+
+        if report_type in DataFactory.LOGGING_REPORT_TYPES:
+            data_reader.set_logger(logger)
+        return data_reader
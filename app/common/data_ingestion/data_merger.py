@@ -1,8 +1,30 @@
+import functools
+
+import numpy as np
 import pandas as pd
 from common.config.logger_config import get_logger
 from common.config.matching_keys_config import get_matching_keys_for_regulator
 from common.config.args_config import Config
 
+# Values of the 'matching_flag' column, stored as categorical codes
+MATCHING_FLAG_CATEGORIES = ['matched', 'left_only', 'right_only']
+
+
+def matching_flag_column(flag, length):
+    """
+    Build a categorical 'matching_flag' column holding the same flag for every row.
+    """
+    codes = np.full(length, MATCHING_FLAG_CATEGORIES.index(flag), dtype=np.int8)
+    return pd.Categorical.from_codes(codes, categories=MATCHING_FLAG_CATEGORIES)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_merger_logger(env, run_date, use_case_name):
+    """
+    Build the DataMerger logger once per (env, run_date, use_case_name) and reuse it across instances.
+    """
+    return get_logger(__name__, env, run_date, use_case_name=use_case_name)
+
 
 class DataMerger:
     def __init__(self, df_left, df_right, regulator, asset_class=None, left_prefix='', right_prefix='',
@@ -12,58 +34,58 @@ class DataMerger:
         Matching keys will be dynamically loaded based on the regulator and asset class.
         """
         self.use_case_name = use_case_name
-        self.logger = get_logger(__name__, Config().env.lower(), Config().run_date.lower(),
-                                 use_case_name=self.use_case_name)
+        config = Config()
+        self.logger = _get_merger_logger(config.env.lower(), config.run_date.lower(), self.use_case_name)
 
-        # Instead of copying entire dataframes, we'll only add prefixes to column names
+        # The input dataframes are neither copied nor renamed; prefixes are only applied to the merge output
         self.df_left = df_left
         self.df_right = df_right
         self.left_prefix = left_prefix
         self.right_prefix = right_prefix
 
-        # Store original column names and dtypes
+        # Store original column names
         self.left_columns = df_left.columns
         self.right_columns = df_right.columns
 
-        # Add prefixes to column names without copying data
-        self.df_left.columns = [f"{left_prefix}{col}" for col in df_left.columns]
-        self.df_right.columns = [f"{right_prefix}{col}" for col in df_right.columns]
+        # Prebuild the prefixed column names used in the merge output
+        self.left_prefixed_columns = pd.Index([f"{left_prefix}{col}" for col in self.left_columns])
+        self.right_prefixed_columns = pd.Index([f"{right_prefix}{col}" for col in self.right_columns])
+        self.matched_columns = self.left_prefixed_columns.append(self.right_prefixed_columns)
 
-        # Get matching keys with prefixes
+        # Get matching keys (original, unprefixed column names)
         self.on_keys_list = [
-            (f"{left_prefix}{key[0]}", f"{right_prefix}{key[1]}")
+            (key[0], key[1])
             for key in get_matching_keys_for_regulator(regulator, asset_class)
         ]
 
-    def _process_matches(self, df_left, df_right, keys):
+    def _process_matches(self, left_values, right_values, keys):
         """
-        Process a single pair of matching keys.
-        Returns indices of matched records and the matched data.
+        Process a single pair of matching keys, given the key values of the records still unmatched.
+        Returns positions (into left_values/right_values) of the matched records.
         """
-        # Perform merge on specific columns only
         left_key, right_key = keys
-        merge_result = pd.merge(
-            df_left[[left_key]].reset_index(),
-            df_right[[right_key]].reset_index(),
-            left_on=left_key,
-            right_on=right_key,
-            how='inner'
-        )
-
-        if not merge_result.empty:
-            # Get matched records using loc with integer indexing
-            matched_left = df_left.iloc[merge_result['index_x']]
-            matched_right = df_right.iloc[merge_result['index_y']]
-
-            # Create matched DataFrame efficiently
-            matched_data = pd.concat([matched_left, matched_right], axis=1)
-            matched_data.insert(len(matched_data.columns), 'matching_flag', ['matched'] * len(matched_data))
-
-            self.logger.info(f'{left_key} <--> {right_key} || {len(merge_result)} records were matched.')
-
-            return merge_result['index_x'], merge_result['index_y'], matched_data
-
-        return pd.Index([]), pd.Index([]), pd.DataFrame()
+        right_index = pd.Index(right_values)
+
+        if right_index.is_unique:
+            # Unique right keys: probe the right-hand hash index directly with the left key values
+            right_for_left = right_index.get_indexer(left_values)
+            left_positions = np.flatnonzero(right_for_left >= 0)
+            right_positions = right_for_left[left_positions]
+        else:
+            # Duplicate right keys: perform merge on the key values only, carrying each row's position
+            merge_result = pd.merge(
+                pd.DataFrame({'key': left_values, 'position': np.arange(len(left_values))}),
+                pd.DataFrame({'key': right_values, 'position': np.arange(len(right_values))}),
+                on='key',
+                how='inner'
+            )
+            left_positions = merge_result['position_x'].to_numpy()
+            right_positions = merge_result['position_y'].to_numpy()
+
+        if left_positions.size:
+            self.logger.info(f'{left_key} <--> {right_key} || {len(left_positions)} records were matched.')
+
+        return left_positions, right_positions
 
     def merge_data(self, return_type='full'):
         """
@@ -73,75 +95,84 @@ class DataMerger:
             raise ValueError(
                 f"Invalid return_type '{return_type}'. Must be one of 'left', 'right', 'inner', or 'full'.")
 
-        # Initialize indices for tracking matched records
-        left_matched_indices = pd.Index([])
-        right_matched_indices = pd.Index([])
-        matched_dfs = []
+        # Track still-unmatched records by position, so each key pass costs O(N) instead of an index lookup
+        left_unmatched_mask = np.ones(len(self.df_left), dtype=bool)
+        right_unmatched_mask = np.ones(len(self.df_right), dtype=bool)
+
+        # Positions of matched record pairs, accumulated across key passes and materialized once at the end
+        matched_left_positions = []
+        matched_right_positions = []
 
         # Process each pair of keys
         for keys in self.on_keys_list:
-            # Get unmatched records indices
-            left_unmatched_mask = ~self.df_left.index.isin(left_matched_indices)
-            right_unmatched_mask = ~self.df_right.index.isin(right_matched_indices)
+            # Get positions of the unmatched records
+            left_remaining = np.flatnonzero(left_unmatched_mask)
+            right_remaining = np.flatnonzero(right_unmatched_mask)
 
-            if not left_unmatched_mask.any() or not right_unmatched_mask.any():
+            if not left_remaining.size or not right_remaining.size:
                 break
 
-            # Process only unmatched records
-            temp_left = self.df_left[left_unmatched_mask]
-            temp_right = self.df_right[right_unmatched_mask]
-
-            # Store original indices
-            temp_left.index = range(len(temp_left))
-            temp_right.index = range(len(temp_right))
-
-            # Process matches for current key pair
-            new_left_indices, new_right_indices, matched_df = self._process_matches(temp_left, temp_right, keys)
-
-            if not matched_df.empty:
-                matched_dfs.append(matched_df)
-                # Update matched indices
-                left_matched_indices = left_matched_indices.union(temp_left.index[new_left_indices])
-                right_matched_indices = right_matched_indices.union(temp_right.index[new_right_indices])
+            # Process matches for current key pair, on the key values of unmatched records only
+            left_key, right_key = keys
+            new_left_positions, new_right_positions = self._process_matches(
+                self.df_left[left_key].to_numpy()[left_remaining],
+                self.df_right[right_key].to_numpy()[right_remaining],
+                keys
+            )
+
+            if new_left_positions.size:
+                # Map positions in the filtered key values back to the original frames
+                new_left_positions = left_remaining[new_left_positions]
+                new_right_positions = right_remaining[new_right_positions]
+                matched_left_positions.append(new_left_positions)
+                matched_right_positions.append(new_right_positions)
+                left_unmatched_mask[new_left_positions] = False
+                right_unmatched_mask[new_right_positions] = False
 
         # Process unmatched records based on return_type
         result_dfs = []
 
-        if matched_dfs:
-            result_dfs.extend(matched_dfs)
+        if matched_left_positions:
+            left_positions = np.concatenate(matched_left_positions)
+            right_positions = np.concatenate(matched_right_positions)
+
+            # Create matched DataFrame with a single row selection per side and apply the prefixes in one go
+            matched_data = pd.concat([
+                self.df_left.iloc[left_positions].reset_index(drop=True),
+                self.df_right.iloc[right_positions].reset_index(drop=True),
+            ], axis=1)
+            matched_data.columns = self.matched_columns
+            matched_data['matching_flag'] = matching_flag_column('matched', len(matched_data))
+            result_dfs.append(matched_data)
 
         if return_type in {'left', 'full'}:
-            left_unmatched = self.df_left[~self.df_left.index.isin(left_matched_indices)]
+            left_unmatched = self.df_left[left_unmatched_mask]
             if not left_unmatched.empty:
-                # Create empty DataFrame with NaN/None values for right columns
-                right_empty_data = {
-                    f"{self.right_prefix}{col}": pd.Series([None] * len(left_unmatched))
-                    for col in self.right_columns
-                }
+                left_unmatched.columns = self.left_prefixed_columns
+                # Create empty DataFrame with None values for right columns from a single block,
+                # aligned on the left records' index
+                right_empty_block = pd.DataFrame(
+                    np.full((len(left_unmatched), len(self.right_prefixed_columns)), None, dtype=object),
+                    columns=self.right_prefixed_columns,
+                    index=left_unmatched.index,
+                    copy=False
+                )
                 # Create unmatched DataFrame with empty right columns
-                df_unmatched = pd.concat([left_unmatched, pd.DataFrame(right_empty_data)], axis=1)
-                df_unmatched.insert(len(df_unmatched.columns), 'matching_flag', ['left_only'] * len(df_unmatched))
+                df_unmatched = pd.concat([left_unmatched, right_empty_block], axis=1)
+                df_unmatched['matching_flag'] = matching_flag_column('left_only', len(df_unmatched))
                 result_dfs.append(df_unmatched)
             elif not result_dfs:  # No matches and return_type is 'left'
                 # Return empty DataFrame with all columns
-                return pd.DataFrame(columns=[
-                    *[f"{self.left_prefix}{col}" for col in self.left_columns],
-                    *[f"{self.right_prefix}{col}" for col in self.right_columns],
-                    'matching_flag'
-                ])
+                return pd.DataFrame(columns=[*self.matched_columns, 'matching_flag'])
 
         if return_type in {'right', 'full'}:
-            right_unmatched = self.df_right[~self.df_right.index.isin(right_matched_indices)]
+            right_unmatched = self.df_right[right_unmatched_mask]
             if not right_unmatched.empty:
                 right_unmatched = right_unmatched.copy()
-                right_unmatched.insert(len(right_unmatched.columns), 'matching_flag',
-                                       ['right_only'] * len(right_unmatched))
+                right_unmatched.columns = self.right_prefixed_columns
+                right_unmatched['matching_flag'] = matching_flag_column('right_only', len(right_unmatched))
                 result_dfs.append(right_unmatched)
 
-        # Restore original column names
-        self.df_left.columns = self.left_columns
-        self.df_right.columns = self.right_columns
-
         # Concatenate results only once at the end
         if not result_dfs:
             return pd.DataFrame(columns=[*self.left_columns, *self.right_columns, 'matching_flag'])
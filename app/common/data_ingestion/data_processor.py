@@ -21,8 +21,9 @@ class DataProcessor:
                                                        self.asset_class, self.dtype,
                                                        regime=self.regime, logger=self.logger)
 
-    def process_data(self, file_paths):
+    def process_data(self, file_paths, usecols=None):
         """
         Process the data from the provided file paths using the data reader.
+        usecols optionally restricts the columns read.
         """
-        return self.data_reader.get_report(file_paths)
+        return self.data_reader.get_report(file_paths, usecols=usecols)
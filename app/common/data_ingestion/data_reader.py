@@ -1,9 +1,88 @@
+import io
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import pandas as pd
 
 from common import constants
 from common.data_ingestion.data_filters import TSRFilters
 from common.config.tsr_attribute_mappings import PRODUCT_TAXONOMY
+from common.config.upstream_attribute_mappings import HARMONIZED_UTI_PREFIX
+
+# Translation table replacing non-printable ASCII characters in column names with '_'
+NON_PRINTABLE_TRANSLATION = str.maketrans({chr(code): '_' for code in [*range(32), 127]})
+
+
+def prefetch_file(path):
+    """
+    Asks the OS to start reading a file into the page cache in the background (POSIX only),
+    so that its I/O overlaps with whatever is parsed in the meantime. Best effort: errors are ignored.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def find_footer_start(handle, skipfooter, block_size=1 << 16):
+    """
+    Returns the byte offset at which the last skipfooter lines of a binary file start, scanning
+    backwards from the end of the file in blocks. Line breaks at the very end of the file don't
+    start more lines. Returns 0 if the file has no more than skipfooter lines.
+    """
+    position = handle.seek(0, os.SEEK_END)
+    breaks_needed = skipfooter
+    at_end = True
+    while position > 0:
+        start = max(0, position - block_size)
+        handle.seek(start)
+        block = handle.read(position - start)
+        position = start
+        if at_end:
+            # Skip the trailing line breaks, which may span several blocks
+            block = block.rstrip(b'\r\n')
+            if not block:
+                continue
+            at_end = False
+
+        index = len(block)
+        while breaks_needed:
+            index = block.rfind(b'\n', 0, index)
+            if index < 0:
+                break
+            breaks_needed -= 1
+        if not breaks_needed:
+            return start + index + 1
+    return 0
+
+
+class _LimitedReader(io.RawIOBase):
+    """
+    Read-only view of the first limit bytes of a binary file handle, from its current position.
+    """
+
+    def __init__(self, handle, limit):
+        super().__init__()
+        self._handle = handle
+        self._remaining = limit
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._remaining <= 0:
+            return 0
+        size = self._handle.readinto(memoryview(buffer)[:min(len(buffer), self._remaining)])
+        self._remaining -= size
+        return size
 
 
 class DataReader(ABC):
@@ -36,6 +115,13 @@ class DataReader(ABC):
         self.logger = logger
         self.nrows = nrows  # Number of rows to read
 
+    def set_logger(self, logger):
+        """
+        Sets the logger used for logging messages. Readers are shared by the DataFactory cache,
+        so the logger is injected per retrieval rather than fixed at construction.
+        """
+        self.logger = logger
+
     @abstractmethod
     def get_report(self, file_paths, usecols=None, nrows=None):
         """
@@ -43,9 +129,11 @@ class DataReader(ABC):
         """
         pass
 
-    def read_csv_data(self, file_paths, dtype=None, usecols=None, nrows=None):
+    def read_csv_data(self, file_paths, dtype=None, usecols=None, nrows=None, unique_key=None):
         """
-        Reads the data from CSV files in chunks for memory efficiency.
+        Reads the data from CSV files, in chunks when only the first nrows are needed.
+        If unique_key is given, only the first row for each value of that column is kept; the
+        duplicates are dropped from each chunk as it is read instead of from the combined data.
         """
         # Use the class attribute 'self.nrows' if 'nrows' is not provided
         if nrows is None:
@@ -55,70 +143,126 @@ class DataReader(ABC):
             file_paths = [file_paths]
 
         if all(isinstance(i, str) for i in file_paths):
-            data_frames = []
-
             # Set default chunksize for reading in chunks
             default_chunksize = 500000
 
-            # Adjust chunksize if nrows is specified and less than default_chunksize
-            if nrows is not None and nrows < default_chunksize:
+            # Chunks are only needed to stop early when nrows is specified; otherwise each file is read in
+            # one go, so its rows don't have to be copied a second time when combining the chunks
+            if nrows is None:
+                chunksize = None
+            elif nrows < default_chunksize:
                 chunksize = nrows
             else:
                 chunksize = default_chunksize
 
-            # Create a translation table to replace non-printable ASCII characters with '_'
-            non_printable_chars = ''.join(map(chr, range(0, 32))) + chr(127)
-            translation_table = str.maketrans({char: '_' for char in non_printable_chars})
-
-            total_rows_read = 0  # Keep track of the total number of rows read
-
-            for file in file_paths:
-                reader = pd.read_csv(
-                    file,
-                    skiprows=self.skiprow,
-                    skipfooter=self.skipfooter,
-                    usecols=usecols,
-                    low_memory=False,
-                    dtype=dtype,
-                    encoding='utf-8',
-                    on_bad_lines='skip',
-                    index_col=False,
-                    encoding_errors='strict',
-                    chunksize=chunksize,
-                    engine='python' if self.skipfooter > 0 else 'c',
-                )
-
-                for i, chunk in enumerate(reader):
-                    # Replace control characters in column names with '_', only once
-                    if i == 0 and not data_frames:
-                        chunk.columns = chunk.columns.str.translate(translation_table)
-                        columns = chunk.columns  # Store the processed column names
-                    else:
-                        chunk.columns = columns  # Ensure consistent column names
-
-                    # If nrows is specified, limit the total rows read
-                    if nrows is not None:
-                        remaining_rows = nrows - total_rows_read
-                        if remaining_rows <= 0:
-                            break  # Stop if we've read enough rows
-                        if len(chunk) > remaining_rows:
-                            chunk = chunk.iloc[:remaining_rows]  # Trim the chunk
-                    total_rows_read += len(chunk)
-
-                    # Replace exact matches of 'nan' with empty strings
-                    chunk.replace(to_replace='nan', value='', inplace=True)
-                    data_frames.append(chunk)
-
-                    # Break if we've read enough rows
-                    if nrows is not None and total_rows_read >= nrows:
-                        break  # Stop reading further chunks
-
-            # Combine all data_frames into a single DataFrame
-            df_final = pd.concat(data_frames, ignore_index=True)
+            chunks = self._iter_file_chunks(file_paths, dtype=dtype, usecols=usecols, chunksize=chunksize)
+            if nrows is None and unique_key is None:
+                # Common case: no row limit or key tracking, so the chunks are collected as they are
+                data_frames = list(chunks)
+            else:
+                data_frames = self._collect_chunks(chunks, nrows=nrows, unique_key=unique_key)
+
+            # Combine all data_frames into a single DataFrame; a single frame already has a fresh RangeIndex
+            if len(data_frames) == 1:
+                df_final = data_frames[0]
+            else:
+                df_final = pd.concat(data_frames, ignore_index=True)
             return df_final
 
         raise ValueError("'file_paths' should be a string or a list of strings")
 
+    def _iter_file_chunks(self, file_paths, dtype=None, usecols=None, chunksize=None):
+        """
+        Yields the chunks of all the files in order, with cleaned column names.
+        """
+        for file_index, file in enumerate(file_paths):
+            # Start reading the next file from disk while this one is parsed
+            if file_index + 1 < len(file_paths):
+                prefetch_file(file_paths[file_index + 1])
+
+            for chunk in self._iter_csv_chunks(file, dtype=dtype, usecols=usecols, chunksize=chunksize):
+                # Replace control characters in column names with '_'; each chunk carries its file's header
+                chunk.columns = chunk.columns.str.translate(NON_PRINTABLE_TRANSLATION)
+                yield chunk
+
+    @staticmethod
+    def _collect_chunks(chunks, nrows=None, unique_key=None):
+        """
+        Collects the chunks up to nrows rows in total, dropping rows whose unique_key value was already kept.
+        """
+        data_frames = []
+        total_rows_read = 0  # Keep track of the total number of rows read
+        seen_keys = set()  # unique_key values kept from earlier chunks
+
+        for chunk in chunks:
+            # If nrows is specified, limit the total rows read
+            if nrows is not None:
+                remaining_rows = nrows - total_rows_read
+                if len(chunk) > remaining_rows:
+                    chunk = chunk.iloc[:remaining_rows]  # Trim the chunk
+            total_rows_read += len(chunk)
+
+            if unique_key is not None:
+                # Drop rows repeating a key within the chunk or from an earlier chunk
+                duplicated = chunk[unique_key].duplicated()
+                if seen_keys:
+                    duplicated |= chunk[unique_key].map(seen_keys.__contains__)
+                if duplicated.any():
+                    chunk = chunk[~duplicated]
+                seen_keys.update(chunk[unique_key])
+
+            data_frames.append(chunk)
+
+            # Stop reading further chunks and files once we've read enough rows
+            if nrows is not None and total_rows_read >= nrows:
+                break
+
+        return data_frames
+
+    def _iter_csv_chunks(self, file, dtype=None, usecols=None, chunksize=None):
+        """
+        Yields the chunks of a single CSV file, always using the C parser.
+        Without a chunksize the whole file is yielded as a single chunk.
+
+        The C parser doesn't support skipfooter (and pandas can't iterate with skipfooter at all),
+        so the footer lines are cut off the file at the byte level before it is parsed. Footer lines
+        therefore never reach the parser: one with extra fields can't be skipped as a bad line in place
+        of a data row, and one with missing fields can't change the inferred column types.
+        """
+        skipfooter = self.skipfooter or 0
+        if skipfooter <= 0:
+            yield from self._read_csv_chunks(file, dtype=dtype, usecols=usecols, chunksize=chunksize)
+            return
+
+        with open(file, 'rb') as handle:
+            data_end = find_footer_start(handle, skipfooter)
+            handle.seek(0)
+            source = io.BufferedReader(_LimitedReader(handle, data_end))
+            yield from self._read_csv_chunks(source, dtype=dtype, usecols=usecols, chunksize=chunksize)
+
+    def _read_csv_chunks(self, source, dtype=None, usecols=None, chunksize=None):
+        """
+        Parses a CSV file path or binary handle with the C parser, as an iterable of chunks.
+        """
+        # 'nan' is one of the parser's default NA values, so the literal string never reaches the chunks
+        # and no per-cell replacement pass is needed afterwards
+        chunks = pd.read_csv(
+            source,
+            skiprows=self.skiprow,
+            usecols=usecols,
+            low_memory=False,
+            dtype=dtype,
+            encoding='utf-8',
+            on_bad_lines='skip',
+            index_col=False,
+            encoding_errors='strict',
+            chunksize=chunksize,
+            engine='c',
+        )
+        if chunksize is None:
+            return (chunks,)  # The whole file was read as a single DataFrame
+        return chunks
+
     # Additional methods to read data from other sources (e.g., Excel, databases) can be added here.
 
 
@@ -136,13 +280,37 @@ class DerivOneDataReader(DataReader):
                          asset_class=asset_class, dtype=dtype, regime=regime, logger=logger, nrows=nrows)
         # self.nrows = 1000
 
+        # Identifier prefix columns hold a handful of distinct values, so they are read as categoricals
+        # and the key cleaning only has to process their categories
+        self.categorical_columns = ['USI Prefix', 'UTI Prefix']
+        huti_prefix_col = HARMONIZED_UTI_PREFIX.get(self.asset_class)
+        if huti_prefix_col:
+            self.categorical_columns.append(huti_prefix_col)
+
     def get_report(self, file_paths, usecols=None, nrows=None):
         """
         Reads DerivOne data from the specified file paths.
         """
-        data = self.read_csv_data(file_paths, dtype=self.dtype, usecols=usecols, nrows=nrows)
+        data = self.read_csv_data(file_paths, dtype=self.get_read_dtype(), usecols=usecols, nrows=nrows)
         return data
 
+    def get_read_dtype(self):
+        """
+        Returns self.dtype with the categorical columns read as 'category'.
+        A scalar dtype still applies to every other column.
+        """
+        if isinstance(self.dtype, dict):
+            dtype = dict(self.dtype)
+        elif self.dtype is None:
+            dtype = {}
+        else:
+            default_dtype = self.dtype
+            dtype = defaultdict(lambda: default_dtype)
+
+        for col in self.categorical_columns:
+            dtype.setdefault(col, 'category')
+        return dtype
+
 
 class TSRDataReader(DataReader):
     """
@@ -227,11 +395,9 @@ class GLEIFDataReader(DataReader):
         """
         Reads GLEIF data from the specified file paths.
         """
-        # Use predefined usecols for GLEIF data
-        data = self.read_csv_data(file_paths, dtype=self.dtype, usecols=self.usecols, nrows=self.nrows)
-
-        # Drop duplicates based on LEI
-        data.drop_duplicates(subset=['LEI'], inplace=True)
+        # Use predefined usecols for GLEIF data, dropping duplicates based on LEI while reading
+        data = self.read_csv_data(file_paths, dtype=self.dtype, usecols=self.usecols, nrows=self.nrows,
+                                  unique_key='LEI')
 
         # Create a new column 'Entity Name' with preference for Transliterated name
         data['Entity Name'] = data[
@@ -7,11 +7,46 @@ and Harmonized UTI, along with their prefixes and Party1 LEI where applicable.
 The code is optimized for performance and memory efficiency on large datasets.
 """
 
+import re
+
+import numpy as np
 import pandas as pd
 from common.config import upstream_attribute_mappings
 from common import constants
 from common.config.logger_config import get_logger
 
+# Characters removed from the matching keys; values are already uppercased by clean_columns
+NON_ALPHANUMERIC_PATTERN = re.compile(r'[^A-Z0-9]')
+
+
+def strip_non_alphanumeric(series):
+    """
+    Remove the characters outside [A-Z0-9] from an uppercased string Series.
+    Each distinct value is processed once, and values that are already ASCII alphanumeric
+    skip the regex engine entirely.
+    """
+    codes, uniques = pd.factorize(series)
+    strip = NON_ALPHANUMERIC_PATTERN.sub  # Bound once for the whole column
+    stripped = [value if value.isascii() and value.isalnum() else strip('', value) for value in uniques]
+    # Missing values get code -1, which picks the trailing ''
+    stripped = np.array(stripped + [''], dtype=object)
+    return pd.Series(stripped[codes], index=series.index, name=series.name)
+
+
+def concat_low_cardinality(left, right):
+    """
+    Concatenate two string Series with few distinct values (e.g. Party1 LEI and an identifier prefix)
+    by building each distinct pair once and mapping the results back through the codes.
+    Falls back to plain concatenation when there are more distinct pairs than rows.
+    """
+    left_codes, left_uniques = pd.factorize(left)
+    right_codes, right_uniques = pd.factorize(right)
+    if len(left_uniques) * len(right_uniques) > len(left):
+        return left + right
+
+    pairs = np.array([l_value + r_value for l_value in left_uniques for r_value in right_uniques], dtype=object)
+    return pd.Series(pairs[left_codes * len(right_uniques) + right_codes], index=left.index)
+
 
 class DerivOneKeyGenerator:
     """
@@ -70,7 +105,11 @@ class DerivOneKeyGenerator:
             # Cleaning columns
             self.logger.debug('Cleaning the values in the required columns.')
             for col in self.required_columns:
-                self.data[col] = self.data[col].fillna('').astype(str).str.strip().str.upper()
+                # Clean each distinct value once (the used categories, for categorical columns) and map the
+                # results back through the codes; missing values get code -1, which picks the trailing ''
+                codes, uniques = pd.factorize(self.data[col])
+                cleaned = np.append(uniques.astype(str).str.strip().str.upper().to_numpy(dtype=object), '')
+                self.data[col] = cleaned[codes]
         except Exception as e:
             self.logger.error(f"Error cleaning columns: {e}")
             raise
@@ -80,8 +119,10 @@ class DerivOneKeyGenerator:
         Generate matching keys based on business logic.
         """
         try:
-            # Define the regex pattern to remove non-alphanumeric characters
-            pattern = r'[^A-Z0-9]'
+            # Removing non-alphanumeric characters distributes over concatenation, so strip each source
+            # column once instead of every concatenated key. The columns are already uppercase.
+            self.logger.debug('Removing non-alphanumeric characters from the key columns')
+            stripped = {col: strip_non_alphanumeric(self.data[col]) for col in self.required_columns}
 
             # Dictionary to store new columns
             new_columns = {}
@@ -90,31 +131,30 @@ class DerivOneKeyGenerator:
                 # For Equity Derivatives and Swaps
                 self.logger.debug(f'Creating matching keys for {self.asset_class}')
 
-                # Generate matching keys by concatenating relevant columns
-                new_columns['matching_key_usi'] = self.data['USI Prefix'].str.cat(self.data['USI Value'], na_rep='')
-                new_columns['matching_key_uti'] = self.data['UTI Prefix'].str.cat(self.data['UTI Value'], na_rep='')
-                new_columns['matching_key_huti'] = self.data[self.huti_prefix_col].str.cat(self.data[self.huti_value_col], na_rep='')
-                new_columns['matching_key_usi_value'] = self.data['USI Value']
-                new_columns['matching_key_uti_value'] = self.data['UTI Value']
+                # Generate matching keys by concatenating relevant columns; the stripped columns hold no
+                # nulls, so plain concatenation replaces str.cat and its null handling
+                new_columns['matching_key_usi'] = stripped['USI Prefix'] + stripped['USI Value']
+                new_columns['matching_key_uti'] = stripped['UTI Prefix'] + stripped['UTI Value']
+                new_columns['matching_key_huti'] = stripped[self.huti_prefix_col] + stripped[self.huti_value_col]
+                new_columns['matching_key_usi_value'] = stripped['USI Value']
+                new_columns['matching_key_uti_value'] = stripped['UTI Value']
             else:
                 # For other asset classes, include Party1 LEI in the keys
                 self.logger.debug(f'Creating matching keys for {self.asset_class}')
-                party1_lei = self.data[self.party1_lei_col]
-
-                # Generate matching keys by concatenating relevant columns
-                new_columns['matching_key_usi'] = party1_lei.str.cat(self.data['USI Prefix'], na_rep='').str.cat(self.data['USI Value'], na_rep='')
-                new_columns['matching_key_uti'] = party1_lei.str.cat(self.data['UTI Prefix'], na_rep='').str.cat(self.data['UTI Value'], na_rep='')
-                new_columns['matching_key_huti'] = party1_lei.str.cat(self.data[self.huti_prefix_col], na_rep='').str.cat(self.data[self.huti_value_col], na_rep='')
-                new_columns['matching_key_usi_value'] = party1_lei.str.cat(self.data['USI Value'], na_rep='')
-                new_columns['matching_key_uti_value'] = party1_lei.str.cat(self.data['UTI Value'], na_rep='')
-
-            # Remove non-alphanumeric characters and convert to uppercase for all new columns
-            self.logger.debug('Removing non-alphanumeric characters and converting to uppercase')
-            for key in new_columns:
-                new_columns[key] = new_columns[key].str.replace(pattern, '', regex=True).str.upper()
-
-            # Concatenate all new columns to the DataFrame at once
-            self.data = pd.concat([self.data, pd.DataFrame(new_columns)], axis=1)
+                party1_lei = stripped[self.party1_lei_col]
+
+                # Generate matching keys by concatenating relevant columns; the stripped columns hold no
+                # nulls, so plain concatenation replaces str.cat and its null handling.
+                # Party1 LEI and the prefixes take few values, so their combinations are built only once.
+                new_columns['matching_key_usi'] = concat_low_cardinality(party1_lei, stripped['USI Prefix']) + stripped['USI Value']
+                new_columns['matching_key_uti'] = concat_low_cardinality(party1_lei, stripped['UTI Prefix']) + stripped['UTI Value']
+                new_columns['matching_key_huti'] = concat_low_cardinality(party1_lei, stripped[self.huti_prefix_col]) + stripped[self.huti_value_col]
+                new_columns['matching_key_usi_value'] = party1_lei + stripped['USI Value']
+                new_columns['matching_key_uti_value'] = party1_lei + stripped['UTI Value']
+
+            # Add the new columns to the DataFrame in place; concatenating would copy every existing column
+            for col, values in new_columns.items():
+                self.data[col] = values
 
         except Exception as e:
             self.logger.error(f"Error generating keys: {e}")
@@ -1,89 +1,84 @@
+import numpy as np
 import pandas as pd
 from common import constants
 from common.config.upstream_attribute_mappings import (HARMONIZED_UTI_VALUE, PARTY1_LEI)
 from common.config.logger_config import get_logger
 
 
+def to_key_strings(series):
+    """
+    Convert a column to strings with nulls as ''. Categorical columns (e.g. the identifier prefixes read
+    as 'category') are converted to plain values first, as fillna('') needs '' to be one of the categories.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    return series.fillna('').astype(str)
+
+
 class DerivOneDeduplicator:
     """
     Class to remove duplicate trades from DerivOne data based on a deduplication key.
+
+    Both strategies keep the first row of each key:
+    - 'sorted_keys' (default) returns the kept rows ordered by deduplication key.
+    - 'drop_duplicates' keeps the original row order, which skips sorting the keys.
     """
 
-    def __init__(self, data, asset_class, environment, report_date, use_case):
+    DEDUP_STRATEGIES = ('sorted_keys', 'drop_duplicates')
+
+    def __init__(self, data, asset_class, environment, report_date, use_case, dedup_strategy='sorted_keys',
+                 log_to_file=True):
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Input data must be a pandas DataFrame.")
+        if dedup_strategy not in self.DEDUP_STRATEGIES:
+            raise ValueError(f"Invalid dedup strategy: {dedup_strategy}. Must be one of {self.DEDUP_STRATEGIES}.")
 
         self.data = data
         self.asset_class = asset_class
-        self.logger = get_logger(name=__name__, env=environment, date=report_date, use_case_name=use_case)
+        self.dedup_strategy = dedup_strategy
+        self.logger = get_logger(name=__name__, env=environment, date=report_date, use_case_name=use_case,
+                                 log_to_file=log_to_file)
         self.huti_col = HARMONIZED_UTI_VALUE.get(self.asset_class)
         self.party1_lei_col = PARTY1_LEI.get(self.asset_class)
 
     def create_deduplication_key(self):
         """
-        Creates the 'deduplication_key' column.
-        Works with string operations first, then converts to categorical at the end.
+        Creates the 'deduplication_key' column of plain strings.
         """
-        # Pre-allocate a Series for deduplication keys with the same index as the data
-        dedup_keys = pd.Series(index=self.data.index, dtype='object')
-
-        # Process columns in chunks to reduce peak memory usage
-        chunk_size = 100000
-        total_rows = len(self.data)
-
-        for start_idx in range(0, total_rows, chunk_size):
-            end_idx = min(start_idx + chunk_size, total_rows)
-            chunk = self.data.iloc[start_idx:end_idx]
-            chunk_idx = chunk.index
-
-            # Convert to strings and handle nulls
-            huti_values = chunk[self.huti_col].fillna('').astype(str).str.strip()
-            uti_values = chunk['UTI Value'].fillna('').astype(str).str.strip()
-            usi_values = chunk['USI Value'].fillna('').astype(str).str.strip()
-
-            # Create dedup key for chunk using string operations
-            chunk_key = huti_values.copy()
-            chunk_key = chunk_key.where(chunk_key != '', uti_values)
-            chunk_key = chunk_key.where(chunk_key != '', usi_values)
-
-            # Handle missing values
-            mask = chunk_key == ''
-            if mask.any():
-                # Create placeholder values only for missing entries
-                missing_indices = mask[mask].index
-                placeholders = [f'missing_placeholder{i}' for i in
-                                range(start_idx + 1, start_idx + len(missing_indices) + 1)]
-                chunk_key[missing_indices] = placeholders
-
-            # Handle asset class specific prefixes
-            if self.asset_class in [constants.EQUITY_DERIVATIVES, constants.EQUITY_SWAPS]:
-                uti_prefixes = chunk['UTI Prefix'].fillna('').astype(str)
-                usi_prefixes = chunk['USI Prefix'].fillna('').astype(str)
-                prefixes = uti_prefixes.where(huti_values != '', usi_prefixes)
-                chunk_key = prefixes + chunk_key
-                del prefixes, uti_prefixes, usi_prefixes
-            else:
-                if self.party1_lei_col in chunk.columns:
-                    party1_lei = chunk[self.party1_lei_col].fillna('').astype(str)
-                    chunk_key = party1_lei + chunk_key
-                    del party1_lei
-
-            # Assign chunk results directly to pre-allocated Series
-            dedup_keys[chunk_idx] = chunk_key
-
-            # Clean up temporary variables
-            del chunk_key, huti_values, uti_values, usi_values, chunk
-
-        # Create new column all at once and convert to categorical
-        # Using a temporary DataFrame to avoid fragmentation
-        temp_df = pd.DataFrame({'deduplication_key': dedup_keys}, index=self.data.index)
-        self.data = pd.concat([self.data, temp_df], axis=1)
+        # Convert to strings and handle nulls, over whole columns at once
+        huti_values = to_key_strings(self.data[self.huti_col]).str.strip()
+        uti_values = to_key_strings(self.data['UTI Value']).str.strip()
+        usi_values = to_key_strings(self.data['USI Value']).str.strip()
+
+        # Create dedup key using string operations: HUTI, else UTI, else USI
+        has_huti = huti_values != ''
+        dedup_keys = huti_values.where(has_huti, uti_values)
+        dedup_keys = dedup_keys.where(dedup_keys != '', usi_values)
+
+        # Handle missing values with sequentially numbered placeholders
+        mask = dedup_keys == ''
+        missing_count = int(mask.sum())
+        if missing_count:
+            placeholder_numbers = np.arange(1, missing_count + 1).astype(str)
+            dedup_keys[mask] = np.char.add('missing_placeholder', placeholder_numbers).astype(object)
+
+        # Handle asset class specific prefixes
+        if self.asset_class in [constants.EQUITY_DERIVATIVES, constants.EQUITY_SWAPS]:
+            uti_prefixes = to_key_strings(self.data['UTI Prefix'])
+            usi_prefixes = to_key_strings(self.data['USI Prefix'])
+            dedup_keys = uti_prefixes.where(has_huti, usi_prefixes) + dedup_keys
+            del uti_prefixes, usi_prefixes
+        else:
+            if self.party1_lei_col in self.data.columns:
+                dedup_keys = to_key_strings(self.data[self.party1_lei_col]) + dedup_keys
+
+        del huti_values, uti_values, usi_values, has_huti, mask
+
+        # Add the column in place; concatenating a one-column frame would copy every column
+        self.data['deduplication_key'] = dedup_keys
 
         # Clean up
-        del dedup_keys, temp_df
-
-        # Convert to categorical
-        self.data['deduplication_key'] = self.data['deduplication_key'].astype('category')
+        del dedup_keys
 
     def remove_duplicates(self):
         """
@@ -94,13 +89,16 @@ class DerivOneDeduplicator:
 
         self.logger.debug('Removing duplicates...')
 
-        # Get unique indices efficiently
-        unique_indices = (
-            self.data.reset_index()
-            .groupby('deduplication_key', observed=True)['index']
-            .first()
-            .values
-        )
+        if self.dedup_strategy == 'drop_duplicates':
+            # Keep the first row of each key in the original row order
+            self.data = self.data.drop_duplicates(subset=['deduplication_key'], keep='first', ignore_index=True)
+            return self.data
+
+        # Get the position of the first row of each key in one hashing pass, then order the kept rows by key,
+        # the order the previous groupby produced. Only the unique keys are sorted.
+        dedup_keys = self.data['deduplication_key']
+        unique_indices = np.flatnonzero(~dedup_keys.duplicated().to_numpy())
+        unique_indices = unique_indices[np.argsort(dedup_keys.to_numpy()[unique_indices], kind='stable')]
 
         # Use boolean indexing instead of drop_duplicates
         self.data = self.data.iloc[unique_indices]
@@ -109,8 +107,6 @@ class DerivOneDeduplicator:
         # Clean up
         # self.data.drop(columns=['deduplication_key'], inplace=True)
 
-        self.data['deduplication_key'] = self.data['deduplication_key'].astype(str)
-
         return self.data
 
     def run(self):
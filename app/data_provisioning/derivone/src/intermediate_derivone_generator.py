@@ -3,26 +3,96 @@ import sys
 import argparse
 import os
 import gc
+import logging
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
 
 from common.data_ingestion.data_processor import DataProcessor
 from common.config.logger_config import get_logger
 from common.scripts.derivone_deduplicator import DerivOneDeduplicator
 from common.config.filepath_config import FilePathConfig
+from common.config.derivone_dtype_dict import derivone_dtype
 from common.scripts.derivone_key_generator import DerivOneKeyGenerator
 
 
+@functools.lru_cache(maxsize=8)
+def _get_filepath_config(report_date, env):
+    """
+    Create the FilePathConfig for a report date and environment once per process.
+    FilePathConfig holds no per-asset-class state, so one instance serves every asset class.
+    """
+    # Creating instance of FilePathConfig to fetch TSR & DerivOne file paths
+    return FilePathConfig(report_date, env, logger)
+
+
+@functools.lru_cache(maxsize=None)
+def get_derivone_filepaths(report_date, env):
+    """
+    Fetch the DerivOne file paths of all asset classes for a report date.
+    The paths are looked up once per process and shared by the generators of every asset class.
+    The returned dict must not be modified.
+    """
+    return _get_filepath_config(report_date, env).get_derivone_filepaths(report_date=report_date)
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path):
+    """
+    Create a directory (and its parents) if it doesn't exist yet.
+    Each directory is only created once per process, so repeated saves to it skip the mkdir call.
+    """
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 class IntermediateDerivOneGenerator:
     """
     Class to generate intermediate DerivOne data by reading and processing DerivOne files.
     """
 
-    def __init__(self, asset_class, env, report_date):
+    # Rows stringified per to_csv batch; pandas' default (100000 // number of columns) makes
+    # batches of a few hundred rows on the wide DerivOne frames, each with its own per-batch overhead
+    CSV_BATCH_ROWS = 65536
+
+    # String columns with fewer distinct values than this fraction of the rows are stored as categoricals
+    CATEGORY_MAX_RATIO = 0.5
+    # Rows sampled per column to estimate its number of distinct values before converting it
+    CATEGORY_SAMPLE_ROWS = 10000
+
+    # Write buffer of the output CSV file; the files are intermediate artifacts, so they are not fsynced
+    CSV_BUFFER_BYTES = 4 * 1024 * 1024
+
+    # Supported output formats and their file extensions
+    OUTPUT_FORMATS = {'csv': '.csv', 'parquet': '.parquet'}
+
+    def __init__(self, asset_class, env, report_date, csv_chunksize=CSV_BATCH_ROWS, output_format='csv',
+                 usecols=None):
         """
         Initialize the IntermediateDerivOneGenerator.
+        csv_chunksize is the number of rows written to the output CSV per batch.
+        output_format is 'csv' (default) or 'parquet'; Parquet needs pyarrow installed.
+        usecols optionally restricts the DerivOne columns read (all columns by default).
         """
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format: {output_format}. Must be one of {list(self.OUTPUT_FORMATS)}.")
+
         self.asset_class = asset_class
         self.env = env.lower()
         self.report_date = report_date
+        self.csv_chunksize = csv_chunksize
+        self.output_format = output_format
+        self.output_extension = self.OUTPUT_FORMATS[output_format]
+        self.usecols = usecols
+
+        # Use the asset class's configured dtypes, like the diagnostic run, instead of per-chunk inference
+        if asset_class in derivone_dtype:
+            self.dtype = derivone_dtype[asset_class]
+            logger.info('Using specific dtype configuration for %s', asset_class)
+        else:
+            self.dtype = str  # Default dtype if no specific configuration is found
+            logger.info('Using default dtype configuration (str) for %s', asset_class)
 
         # Initialize DataProcessor for DerivOne
         self.data_processor = DataProcessor(
@@ -30,15 +100,12 @@ class IntermediateDerivOneGenerator:
             skiprow=0,
             skipfooter=0,
             asset_class=self.asset_class,
-            dtype=None,
+            dtype=self.dtype,
             logger=logger
         )
 
-        # Creating instance of FilePathConfig to fetch TSR & DerivOne file paths
-        filepath_config = FilePathConfig(self.report_date, self.env, logger)
-
-        # Read DerivOne Files
-        self.derivone_filepaths = filepath_config.get_derivone_filepaths(report_date=report_date)
+        # Read DerivOne Files; the lookup covers all asset classes and is shared between them
+        self.derivone_filepaths = get_derivone_filepaths(self.report_date, self.env)
 
         if not self.derivone_filepaths.get(asset_class):
             error_msg = f"DerivOne file not found for asset class {asset_class} for report date {report_date}"
@@ -46,7 +113,7 @@ class IntermediateDerivOneGenerator:
             logger.error("Terminating program execution due to missing DerivOne file.")
             sys.exit(1)
 
-        logger.info(f"DerivOne File Paths for {asset_class}: {self.derivone_filepaths.get(asset_class)}")
+        logger.info("DerivOne File Paths for %s: %s", asset_class, self.derivone_filepaths.get(asset_class))
 
     def cleanup(self):
         """
@@ -56,7 +123,6 @@ class IntermediateDerivOneGenerator:
             self.data_processor = None
         if hasattr(self, 'derivone_filepaths'):
             self.derivone_filepaths = None
-        gc.collect()
 
     def __enter__(self):
         """
@@ -75,11 +141,12 @@ class IntermediateDerivOneGenerator:
         Read DerivOne data from the specified file paths, generate keys, and deduplicate records.
         """
         try:
-            logger.info(f"Reading DerivOne data from {file_paths}")
+            logger.info("Reading DerivOne data from %s", file_paths)
 
             # Process the data using DataProcessor
-            data = self.data_processor.process_data(file_paths=file_paths)
-            logger.info(f"Successfully read {len(data)} rows from DerivOne file(s)")
+            data = self.data_processor.process_data(file_paths=file_paths, usecols=self.usecols)
+            logger.info("Successfully read %d rows from DerivOne file(s)", len(data))
+            self.downcast_integers(data)
 
             # Generate matching keys
             logger.info("Starting key generation process")
@@ -102,29 +169,67 @@ class IntermediateDerivOneGenerator:
                 environment=self.env,
                 report_date=self.report_date,
                 use_case=use_case_name,
+                # The keys come from DerivOneKeyGenerator above; the original row order is kept
+                dedup_strategy='drop_duplicates',
                 log_to_file=False
             )
             data = deduplicator.run()
             del deduplicator
-            logger.info(f"After deduplication: {len(data)} rows remaining")
+            logger.info("After deduplication: %d rows remaining", len(data))
 
             return data
 
         except Exception as e:
-            logger.error(f"Error reading DerivOne data: {str(e)}", exc_info=True)
+            logger.error("Error reading DerivOne data: %s", e)
             raise
 
+    @staticmethod
+    def downcast_integers(data):
+        """
+        Store the integer columns in the smallest integer type that holds their values, in place,
+        so the later passes over the frame move fewer bytes. The values, and so the output, are unchanged.
+        Float columns are left as float64, since float32 would change the written values.
+        """
+        for col in data.select_dtypes(include='integer').columns:
+            data[col] = pd.to_numeric(data[col], downcast='integer')
+
+    @classmethod
+    def categorize_low_cardinality(cls, data):
+        """
+        Store the string columns with few distinct values as categoricals, in place: integer codes plus
+        one copy of each distinct string. Applied to the deduplicated frame just before it is written, since
+        key generation and deduplication turn their columns back into plain strings. Both the CSV and
+        Parquet writers output the labels, so the output is unchanged.
+        """
+        max_categories = cls.CATEGORY_MAX_RATIO * max(len(data), 1)
+        # Rows spread evenly over the frame, so a sorted file doesn't bias the sample
+        sample_rows = slice(None, None, max(len(data) // cls.CATEGORY_SAMPLE_ROWS, 1))
+        for col in data.select_dtypes(include=['object', 'string']).columns:
+            # High-cardinality columns (trade IDs, keys, ...) are ruled out on the sample, so only the
+            # likely candidates are hashed in full by the conversion
+            sample = data[col].iloc[sample_rows]
+            if sample.nunique(dropna=False) >= cls.CATEGORY_MAX_RATIO * max(len(sample), 1):
+                continue
+            converted = data[col].astype('category')
+            if len(converted.cat.categories) < max_categories:
+                data[col] = converted
+
     @staticmethod
     def validate_data(data):
         """
         Validate the read data for basic quality checks.
         """
-        if data.empty:
+        # Row and column counts are each read once
+        n_rows = len(data)
+        n_columns = len(data.columns)
+        if n_rows == 0 or n_columns == 0:
             logger.warning("No data was read from the DerivOne file(s)")
             return
 
-        logger.info(f"Data shape: {data.shape}")
-        logger.info(f"Columns: {', '.join(data.columns)}")
+        logger.info("Data shape: (%d, %d)", n_rows, n_columns)
+        # Only build the column listing when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Columns: %s", ', '.join(data.columns.tolist()))
 
     def generate_intermediate_data(self):
         """
@@ -137,24 +242,33 @@ class IntermediateDerivOneGenerator:
             return data
 
         except Exception as e:
-            logger.error(f"Error generating intermediate data: {str(e)}", exc_info=True)
+            logger.error("Error generating intermediate data: %s", e)
             raise
 
-    @staticmethod
-    def save_data(data, output_path):
+    def save_data(self, data, output_path):
         """
-        Save the processed data to a CSV file.
+        Save the processed data in the configured output format. CSV output is streamed through one
+        file handle in batches of csv_chunksize rows so only one batch is stringified at a time.
         """
         try:
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-
-            data.to_csv(output_path, index=False)
-            logger.info(f"Data successfully saved to {output_path}")
+            ensure_dir(os.path.dirname(output_path) or '.')
+            self.categorize_low_cardinality(data)
+
+            if self.output_format == 'parquet':
+                # Typed columnar output, no per-cell stringification
+                data.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
+                logger.info("Data successfully saved to %s", output_path)
+                return
+
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_BYTES) as output_file:
+                # An empty frame still gets one (empty) batch so that the header is written
+                for batch_index, start in enumerate(range(0, max(len(data), 1), self.csv_chunksize)):
+                    data.iloc[start:start + self.csv_chunksize].to_csv(output_file, index=False,
+                                                                        header=(batch_index == 0))
+            logger.info("Data successfully saved to %s", output_path)
 
         except Exception as e:
-            logger.error(f"Error saving data to {output_path}: {str(e)}", exc_info=True)
+            logger.error("Error saving data to %s: %s", output_path, e)
             raise
 
 
@@ -164,10 +278,24 @@ def parse_arguments():
     parser.add_argument('-e', '--env', required=True, type=str, help='Environment parameter', choices=['qa', 'prod'])
     parser.add_argument('-d', '--run_date', required=True, help='Run Date or date of execution')
     parser.add_argument('-a', '--asset_classes', nargs='+', help='List of asset classes to process')
+    parser.add_argument('-f', '--output_format', default='csv', help='Output file format',
+                        choices=list(IntermediateDerivOneGenerator.OUTPUT_FORMATS))
+    parser.add_argument('-w', '--max_workers', default=1, type=int,
+                        help='Number of asset classes processed in parallel; each worker needs memory for a full asset class')
     return parser.parse_args()
 
 
-def process_asset_class(asset_class, env, run_date):
+def init_worker(env, run_date, use_case):
+    """
+    Initialize the module-level logger and use case name in a worker process, which doesn't run the
+    __main__ block when processes are spawned.
+    """
+    global logger, use_case_name
+    use_case_name = use_case
+    logger = get_logger(__name__, env, run_date, use_case_name=use_case_name, log_to_file=False)
+
+
+def process_asset_class(asset_class, env, run_date, output_format='csv'):
     """
     Process a single asset class and clean up resources afterward.
     """
@@ -176,39 +304,55 @@ def process_asset_class(asset_class, env, run_date):
         with IntermediateDerivOneGenerator(
                 asset_class=asset_class,
                 env=env,
-                report_date=run_date
+                report_date=run_date,
+                output_format=output_format
         ) as generator:
             # Process the data
             processed_data = generator.generate_intermediate_data()
 
             # Save the processed data
-            output_file = rf'C:\Users\{os.getlogin()}\Morgan Stanley\TTRO Independent Testing - APAC New Build\ASIC + MAS + JFSA\Diagnostic Output\intermediate_derivone\{asset_class}_intermediate_derivone_{run_date}.csv'
+            output_file = rf'C:\Users\{os.getlogin()}\Morgan Stanley\TTRO Independent Testing - APAC New Build\ASIC + MAS + JFSA\Diagnostic Output\intermediate_derivone\{asset_class}_intermediate_derivone_{run_date}{generator.output_extension}'
             generator.save_data(processed_data, output_file)
 
             # Explicitly clean up processed data
             del processed_data
-            gc.collect()
+
+        # A single full collection per asset class, once its frames and generator are released;
+        # reference counting frees them, this only clears any leftover cycles
+        gc.collect()
 
     except Exception as e:
-        logger.error(f"Error processing asset class {asset_class}: {str(e)}", exc_info=True)
+        # Outermost handler for an asset class: the only place the traceback is logged
+        logger.error("Error processing asset class %s: %s", asset_class, e, exc_info=True)
         raise
 
 
 def main():
     """Main function to run the DerivOne data processing."""
     logger.info('*********************Execution Started*********************')
-    logger.info(f'RUN_DATE = {args.run_date}')
-    logger.info(f'ENVIRONMENT = {args.env.upper()}')
-    logger.info(f'ASSET_CLASSES = {args.asset_classes}')
+    logger.info('RUN_DATE = %s', args.run_date)
+    logger.info('ENVIRONMENT = %s', args.env.upper())
+    logger.info('ASSET_CLASSES = %s', args.asset_classes)
+    logger.info('OUTPUT_FORMAT = %s', args.output_format)
+    logger.info('MAX_WORKERS = %s', args.max_workers)
 
     try:
-        for asset_class in args.asset_classes:
-            process_asset_class(asset_class, args.env, args.run_date)
-            # Force garbage collection after each asset class
-            gc.collect()
+        max_workers = min(args.max_workers, len(args.asset_classes))
+        if max_workers > 1:
+            # Each asset class is an independent read -> key generation -> dedup -> save pipeline,
+            # so process them in separate worker processes; each worker holds a full DerivOne frame,
+            # so more workers need proportionally more RAM
+            process_one = functools.partial(process_asset_class, env=args.env, run_date=args.run_date,
+                                            output_format=args.output_format)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                                     initargs=(args.env, args.run_date, use_case_name)) as executor:
+                list(executor.map(process_one, args.asset_classes))
+        else:
+            for asset_class in args.asset_classes:
+                process_asset_class(asset_class, args.env, args.run_date, args.output_format)
 
         logger.info('*********************Execution Finished*********************')
-        logger.info(f'Total time required = {round((time.time() - start_time) / 60, 2)} minutes')
+        logger.info('Total time required = %s minutes', round((time.time() - start_time) / 60, 2))
         return 0
 
     except Exception as e:
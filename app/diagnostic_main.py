@@ -3,6 +3,8 @@ import argparse
 import traceback
 import os
 import json
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 
@@ -10,6 +12,7 @@ from common import constants
 from common.config.args_config import Config
 from common.config.logger_config import get_logger
 from common.data_ingestion.data_processor import DataProcessor
+from common.data_ingestion.data_reader import prefetch_file
 from common import utility
 
 from common.config.ref_data_filepaths import get_ref_data_location
@@ -27,17 +30,54 @@ from diagnostic_pandq.pandq_models.model_generator_api import PANDQModelsGenerat
 from common.config.filepath_config import FilePathConfig
 from common.config.derivone_dtype_dict import derivone_dtype
 
+# TSR key generator of each regime
+TSR_KEY_GENERATORS = {
+    constants.JFSA: JFSATSRKeyGenerator,
+    constants.ASIC: ASICTSRKeyGenerator,
+    constants.MAS: MASTSRKeyGenerator,
+}
+
+# Collateral portfolio code column of the regimes whose non-prod runs only keep the PPF portfolios
+PORTFOLIO_CODE_COLUMNS = {
+    constants.ASIC: "Collateral portfolio code (variation margin)",
+    constants.MAS: "Variation margin collateral portfolio code",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _read_column_mappings(json_file_path):
+    """
+    Reads a column mapping JSON file once per process; the regime's mapping is shared by all its asset classes.
+    The returned dict must not be modified.
+    """
+    with open(json_file_path, 'r') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_saved_columns(json_file):
+    """
+    Reads a saved column list JSON file once per process, as a tuple.
+    save_columns_to_json clears the cache when it rewrites a file.
+    """
+    with open(json_file, 'r') as f:
+        return tuple(json.load(f))  # Load the JSON array
+
 
 def rename_columns_from_json(df, json_file_path):
     """
     Rename specific DataFrame columns based on key-value pairs in a JSON file.
     """
     # Load the JSON file containing only the columns that need to be renamed
-    with open(json_file_path, 'r') as f:
-        column_mappings = json.load(f)
+    column_mappings = _read_column_mappings(json_file_path)
 
-    # Rename DataFrame columns based on JSON key-value pairs (if the columns exist in the DataFrame)
-    df.rename(columns=column_mappings, inplace=True)
+    # Rename DataFrame columns based on JSON key-value pairs (if the columns exist in the DataFrame). The mapping
+    # covers all of the regime's asset classes, so only the entries for this frame's columns are passed on,
+    # and the column index is only rebuilt when one of them applies
+    current_columns = set(df.columns)
+    applicable_mappings = {old: new for old, new in column_mappings.items() if old in current_columns}
+    if applicable_mappings:
+        df.rename(columns=applicable_mappings, inplace=True)
 
     return df
 
@@ -53,6 +93,7 @@ def save_columns_to_json(df, regime_name, asset_class):
     # Save the JSON file
     with open(json_file, 'w') as f:
         json.dump(df.columns.tolist(), f, indent=4)  # Save as a JSON array with indentation for readability
+    _read_saved_columns.cache_clear()  # Drop the previous contents of the file
 
     logger.info(f"Saved columns for {regime_name}-{asset_class} at {json_file}")
 
@@ -65,15 +106,13 @@ def load_columns_from_json(regime_name, asset_class):
     column_json_location = get_column_json_location(Config().env.lower())
     json_file = column_json_location.get(regime_name).get(asset_class)
 
-    # Check if the JSON file exists
-    if not os.path.exists(json_file):
+    # Load the JSON file, failing if it doesn't exist
+    try:
+        saved_columns = list(_read_saved_columns(json_file))
+    except FileNotFoundError:
         logger.error(f"JSON file not found: {json_file}. Cannot validate columns for {asset_class}.")
         raise FileNotFoundError(f"JSON file not found: {json_file}")
 
-    # Load the JSON file
-    with open(json_file, 'r') as f:
-        saved_columns = json.load(f)  # Load the JSON array
-
     logger.info(f"Loaded columns from JSON for {regime_name}-{asset_class}.")
     return saved_columns
 
@@ -82,8 +121,10 @@ def log_matching_status_summary(report_date, asset_class, df, summary_dict):
     """
     Records the value counts of the 'matching_status' column for each asset class and stores them in a summary dictionary.
     """
-    # Extract the counts of each unique value in the 'matching_status' column
-    status_counts = df['matching_flag'].value_counts().to_dict()
+    # Extract the counts of each unique value in the 'matching_status' column. clean_data has already turned the
+    # flag into a plain string column, so only the statuses present are counted.
+    # The Series is kept as is: the summary only needs .keys() and .get() on it.
+    status_counts = df['matching_flag'].value_counts()
 
     # Store the counts in the summary dictionary
     summary_dict[asset_class] = {
@@ -116,7 +157,7 @@ def print_matching_status_summary(summary_dict):
         logger.info(f"{' | '.join(row)}")
 
 
-def apply_pandq_processing(df_merged, asset_class):
+def apply_pandq_processing(df_merged, asset_class, output_format='csv'):
     """
     Applies PANDQ-specific data processing to the merged dataset.
     """
@@ -130,7 +171,8 @@ def apply_pandq_processing(df_merged, asset_class):
         logger.error(f"No output file path found for regime: {regime}, asset class: {asset_class}")
         raise ValueError(f"No output file path found for regime: {regime}, asset class: {asset_class}")
 
-    data_processor = PANDQDataProcessor(output_filepath=output_filepath, data=df_merged)
+    data_processor = PANDQDataProcessor(output_filepath=output_filepath, data=df_merged,
+                                        output_format=output_format)
 
     data_processor.clean_data()  # Clean the merged data
 
@@ -141,14 +183,16 @@ def merge_datasets(df_tsr, df_derivone, asset_class):
     """
     Merges TSR and DerivOne data for a given asset class.
     """
+    regime = Config().regime.upper()
+
     # Merge TSR and DerivOne data
     data_merger = DataMerger(
         df_left=df_tsr, df_right=df_derivone,
-        regulator=Config().regime.upper(), asset_class=asset_class,
+        regulator=regime, asset_class=asset_class,
         left_prefix='TSR_', right_prefix='Deriv1_', use_case_name=use_case_name
     )
     df_merged = data_merger.merge_data(return_type='left')
-    logger.info(f'{Config().regime.upper()}-{asset_class} merged data shape: {df_merged.shape}')
+    logger.info(f'{regime}-{asset_class} merged data shape: {df_merged.shape}')
     return df_merged
 
 
@@ -165,6 +209,9 @@ def process_derivone(report_date, asset_class, filepath_config):
     """
     Processes DerivOne data for a given asset class.
     """
+    config = Config()
+    env = config.env.lower()
+
     # Read DerivOne Files
     derivone_filepaths = filepath_config.get_derivone_filepaths(report_date=report_date)
     logger.info('Started reading DerivOne Report')
@@ -187,14 +234,14 @@ def process_derivone(report_date, asset_class, filepath_config):
     logger.info(f'DerivOne Shape before deleting duplicates: {df_derivone.shape}')
 
     # Deduplicate DerivOne data
-    d1_deduplicator = DerivOneDeduplicator(data=df_derivone, asset_class=asset_class, environment=Config().env.lower(),
-                                           report_date=Config().run_date, use_case=use_case_name)
+    d1_deduplicator = DerivOneDeduplicator(data=df_derivone, asset_class=asset_class, environment=env,
+                                           report_date=config.run_date, use_case=use_case_name)
     df_derivone = d1_deduplicator.run()
     logger.info(f'DerivOne Shape after deleting duplicates: {df_derivone.shape}')
 
     logger.info('Started creating matching keys in DerivOne Report')
     deriv1_key_generator = DerivOneKeyGenerator(data=df_derivone, asset_class=asset_class,
-                                                environment=Config().env.lower(), report_date=Config().run_date,
+                                                environment=env, report_date=config.run_date,
                                                 use_case=use_case_name)
     df_derivone = deriv1_key_generator.generate_keys()
     logger.info('Finished creating matching keys in DerivOne Report')
@@ -202,59 +249,57 @@ def process_derivone(report_date, asset_class, filepath_config):
     return df_derivone
 
 
+def keep_ppf_portfolios(df, regime, asset_class):
+    """
+    Keeps only the rows of the PPF collateral portfolios, for the regimes listed in PORTFOLIO_CODE_COLUMNS.
+    Only used outside prod.
+    """
+    portfolio_code_column = PORTFOLIO_CODE_COLUMNS.get(regime)
+    if portfolio_code_column is None:
+        return df
+
+    logger.info(f'{regime}-{asset_class} TSR Shape: {df.shape}')
+    # "PPF" is a literal substring, so a plain substring search replaces the regex engine
+    return df[df[portfolio_code_column].str.contains("PPF", na=False, regex=False)]
+
+
 def process_tsr(tsr_filepaths, asset_class, df_gleif):
     """
     Processes TSR data for a given asset class.
     """
+    config = Config()
+    regime = config.regime.upper()
+    env = config.env.lower()
+
     # Read TSR Files
     df_tsr = read_datasets(
         report_type='tsr',
         filepath_list=tsr_filepaths.get(asset_class),
-        skiprow=constants.TSR_SKIPROWS.get(Config().regime.upper()),
-        skipfooter=constants.TSR_SKIPFOOTERS.get(Config().regime.upper()),
+        skiprow=constants.TSR_SKIPROWS.get(regime),
+        skipfooter=constants.TSR_SKIPFOOTERS.get(regime),
         asset_class=asset_class,
         dtype=str,
-        regime=Config().regime.upper()
+        regime=regime
     )
 
-    tsr_key_generator = None
-
-    # Generate keys if regime is JFSA
-    if Config().regime.upper() == constants.JFSA:
-        tsr_key_generator = JFSATSRKeyGenerator(data=df_tsr, asset_class=asset_class,
-                                                environment=Config().env.lower(), report_date=Config().run_date,
-                                                use_case=use_case_name)
-
-    # Generate keys if regime is ASIC
-    elif Config().regime.upper() == constants.ASIC:
-        if Config().env.lower() not in ['prod']:
-            logger.info(f'{Config().regime.upper()}-{asset_class} TSR Shape: {df_tsr.shape}')
-            df_tsr = df_tsr[df_tsr["Collateral portfolio code (variation margin)"].str.contains("PPF", na=False)]
-
-        tsr_key_generator = ASICTSRKeyGenerator(data=df_tsr, asset_class=asset_class,
-                                                environment=Config().env.lower(), report_date=Config().run_date,
-                                                use_case=use_case_name)
-
-    # Generate keys if regime is ASIC
-    elif Config().regime.upper() == constants.MAS:
-        if Config().env.lower() not in ['prod']:
-            logger.info(f'{Config().regime.upper()}-{asset_class} TSR Shape: {df_tsr.shape}')
-            df_tsr = df_tsr[df_tsr["Variation margin collateral portfolio code"].str.contains("PPF", na=False)]
+    if env not in ['prod']:
+        df_tsr = keep_ppf_portfolios(df_tsr, regime, asset_class)
 
-        tsr_key_generator = MASTSRKeyGenerator(data=df_tsr, asset_class=asset_class,
-                                               environment=Config().env.lower(), report_date=Config().run_date,
-                                               use_case=use_case_name)
-
-    if tsr_key_generator:
+    # Generate keys with the regime's key generator
+    tsr_key_generator_class = TSR_KEY_GENERATORS.get(regime)
+    if tsr_key_generator_class:
+        tsr_key_generator = tsr_key_generator_class(data=df_tsr, asset_class=asset_class,
+                                                    environment=env, report_date=config.run_date,
+                                                    use_case=use_case_name)
         tsr_key_generator.validate_columns()  # Validate required columns for key generation
         tsr_key_generator.clean_columns(tsr_key_generator.required_columns)  # Clean and preprocess columns
         df_tsr = tsr_key_generator.generate_keys()  # Generate matching keys
 
     # Map LEI values to Entity Names and add corresponding columns to the dataframe.
-    lei_columns = TSR_COLUMNS_WITH_LEI.get(Config().regime.upper())
+    lei_columns = TSR_COLUMNS_WITH_LEI.get(regime)
     df_tsr = utility.add_entity_names(input_df=df_tsr, gleif_dict=df_gleif, lei_columns=lei_columns)
 
-    logger.info(f'{Config().regime.upper()}-{asset_class} TSR Shape: {df_tsr.shape}')
+    logger.info(f'{regime}-{asset_class} TSR Shape: {df_tsr.shape}')
 
     return df_tsr
 
@@ -263,37 +308,33 @@ def process_msr(tsr_filepaths, asset_class, df_gleif):
     """
     Processes TSR data for a given asset class.
     """
+    config = Config()
+    regime = config.regime.upper()
+
     # Read TSR Files
     df_msr = read_datasets(
         report_type='msr',
         filepath_list=tsr_filepaths.get(asset_class),
-        skiprow=constants.MSR_SKIPROWS.get(Config().regime.upper()),
-        skipfooter=constants.MSR_SKIPFOOTERS.get(Config().regime.upper()),
+        skiprow=constants.MSR_SKIPROWS.get(regime),
+        skipfooter=constants.MSR_SKIPFOOTERS.get(regime),
         asset_class=asset_class,
         dtype=str,
-        regime=Config().regime.upper()
+        regime=regime
     )
 
-    if Config().regime.upper() == constants.ASIC:
-        if Config().env.lower() not in ['prod']:
-            logger.info(f'{Config().regime.upper()}-{asset_class} TSR Shape: {df_msr.shape}')
-            df_msr = df_msr[df_msr["Collateral portfolio code (variation margin)"].str.contains("PPF", na=False)]
-
-    # Generate keys if regime is ASIC
-    elif Config().regime.upper() == constants.MAS:
-        if Config().env.lower() not in ['prod']:
-            logger.info(f'{Config().regime.upper()}-{asset_class} TSR Shape: {df_msr.shape}')
-            df_msr = df_msr[df_msr["Variation margin collateral portfolio code"].str.contains("PPF", na=False)]
+    if config.env.lower() not in ['prod']:
+        df_msr = keep_ppf_portfolios(df_msr, regime, asset_class)
 
     # Map LEI values to Entity Names and add corresponding columns to the dataframe.
-    lei_columns = MSR_COLUMNS_WITH_LEI.get(Config().regime.upper())
+    lei_columns = MSR_COLUMNS_WITH_LEI.get(regime)
     df_msr = utility.add_entity_names(input_df=df_msr, gleif_dict=df_gleif, lei_columns=lei_columns)
 
-    logger.info(f'{Config().regime.upper()}-{asset_class} MSR Shape: {df_msr.shape}')
+    logger.info(f'{regime}-{asset_class} MSR Shape: {df_msr.shape}')
     return df_msr
 
 
-def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config, update_columns_flag):
+def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config, update_columns_flag,
+                        output_format='csv'):
     """
     Processes a single asset class by reading, cleaning, and merging datasets,
     and applying PANDQ-specific data processing.
@@ -315,8 +356,8 @@ def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config,
 
             logger.info('Adding report_date to underlying data')
             # df_merged.loc[:, 'report_date'] = pd.Series(report_date, index=df_merged.index)
-            df_merged = pd.concat([df_merged, pd.DataFrame({'report_date': report_date},
-                                                           index=df_merged.index)], axis=1)
+            # Broadcast the scalar into a new column in place; concatenating would copy every existing column
+            df_merged['report_date'] = report_date
 
             # Clean up unused variables and log memory usage
             utility.log_memory_usage_before_after_gc(logger=logger)
@@ -334,23 +375,28 @@ def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config,
 
             logger.info('Adding report_date to underlying data')
             # df_merged.loc[:, 'report_date'] = pd.Series(report_date, index=df_merged.index)
-            df_merged = pd.concat([df_merged, pd.DataFrame({'report_date': report_date},
-                                                           index=df_merged.index)], axis=1)
+            # Broadcast the scalar into a new column in place; concatenating would copy every existing column
+            df_merged['report_date'] = report_date
 
             # Clean up unused variables and log memory usage
             del df_tsr, df_derivone
             utility.log_memory_usage_before_after_gc(logger=logger)
 
             # Handle column validation or saving
-            df_merged['matching_flag'] = df_merged['matching_flag'].replace('left_only', 'unmatched')
+            matching_flag = df_merged['matching_flag']
+            if isinstance(matching_flag.dtype, pd.CategoricalDtype):
+                # DataMerger stores the flag as a categorical: renaming the category relabels every row at once
+                df_merged['matching_flag'] = matching_flag.cat.rename_categories({'left_only': 'unmatched'})
+            else:
+                df_merged['matching_flag'] = matching_flag.replace('left_only', 'unmatched')
 
         # Apply PANDQ-specific processing on the merged data
         logger.info(f'Applying PANDQ Processing...')
-        data_processor = apply_pandq_processing(df_merged, asset_class)
+        data_processor = apply_pandq_processing(df_merged, asset_class, output_format)
         logger.info(f'PANDQ Processing Finished.')
 
         # Now perform the column renaming on data_processor.data after PANDQ processing
-        json_file_path = get_model_configs(env=Config().env).get(Config().regime.upper())['column_mapping']
+        json_file_path = get_model_configs(env=Config().env).get(regime_name)['column_mapping']
         data_processor.data = rename_columns_from_json(data_processor.data, json_file_path)
 
         column_json_location = get_column_json_location(Config().env.lower())
@@ -371,8 +417,10 @@ def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config,
             if new_columns:
                 logger.warning(f"New columns detected that are not in the saved JSON: {new_columns}")
 
-            # Use only the columns that are saved in the JSON
-            data_processor.data = data_processor.data[saved_columns]
+            # Use only the columns that are saved in the JSON; when the frame already has exactly those columns
+            # in that order, selecting them would only copy the whole frame
+            if data_processor.data.columns.tolist() != saved_columns:
+                data_processor.data = data_processor.data[saved_columns]
 
         # Save the cleaned and updated data
         logger.info(f'Saving the final processed data...')
@@ -387,19 +435,91 @@ def process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config,
         raise
 
 
+def process_and_summarize_asset_class(asset_class, tsr_filepaths, update_columns_flag, output_format='csv',
+                                      gleif_dict=None, filepath_config=None):
+    """
+    Processes a single asset class and returns only what main() needs from the result, so that a worker
+    process doesn't send the processed DataFrame back to the parent.
+
+    Parameters:
+        gleif_dict (dict, optional): LEI to entity name lookup; defaults to the one set up by init_worker.
+        filepath_config (FilePathConfig, optional): Defaults to the one built by init_worker.
+
+    Returns:
+        tuple: The report date and the matching status summary (None for Collateral),
+               or None if no data was processed.
+    """
+    if gleif_dict is None:
+        gleif_dict = worker_gleif_dict
+    if filepath_config is None:
+        filepath_config = worker_filepath_config
+
+    df_merged = process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config, update_columns_flag,
+                                    output_format)
+    if df_merged is None or df_merged.empty:
+        return None
+
+    logger.info(f'Creating Report Date column in final output...')
+    report_date = df_merged['report_date'].iloc[0]
+    summary = {}
+    if asset_class not in [constants.COLLATERAL]:
+        logger.info(f'Creating Matching Summary Report...')
+        log_matching_status_summary(report_date, asset_class, df_merged, summary)
+    return report_date, summary.get(asset_class)
+
+
+def enable_copy_on_write():
+    """
+    Turns on copy-on-write for the run: derived frames share their parents' column buffers until one of them
+    is modified, instead of copying them eagerly. Always on from pandas 3, where the option is deprecated.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+
+def prefetch_tsr_files(tsr_filepaths, asset_class):
+    """
+    Asks the OS to start reading an asset class's TSR files into the page cache in the background,
+    so that their disk reads overlap with the processing of the current asset class.
+    """
+    for file_path in tsr_filepaths.get(asset_class) or ():
+        prefetch_file(file_path)
+
+
+def init_worker(env, regime, run_date, gleif_dict):
+    """
+    Initializes the global configuration, output locations, logger, file path configuration and GLEIF lookup
+    in a worker process, which doesn't run the __main__ block when processes are spawned.
+    The GLEIF lookup is passed once per worker instead of with every asset class. FilePathConfig holds
+    the compiled file name templates, which can't be pickled, so each worker builds its own.
+    """
+    global OUTPUT_LOCATION, logger, use_case_name, worker_gleif_dict, worker_filepath_config
+    use_case_name = 'diagnostic_pandq'
+    Config(env=env, regime=regime, run_date=run_date)
+    OUTPUT_LOCATION = get_output_location(Config().env.lower())
+    logger = get_logger(__name__, Config().env, Config().run_date, use_case_name=use_case_name)
+    worker_gleif_dict = gleif_dict
+    worker_filepath_config = FilePathConfig(Config().run_date, Config().env.lower(), logger)
+    enable_copy_on_write()
+
+
 def main():
     """
     Main function that orchestrates the processing of all asset classes for the given regime.
     """
+    regime = Config().regime.upper()
+    env = Config().env.lower()
+    enable_copy_on_write()
+
     # Creating instance of FilePathConfig to fetch TSR & DerivOne file paths
-    filepath_config = FilePathConfig(Config().run_date, Config().env.lower(), logger)
+    filepath_config = FilePathConfig(Config().run_date, env, logger)
 
     # Determine asset classes to process
-    asset_classes = args.asset_classes if args.asset_classes else constants.ASSET_CLASS_LIST.get(Config().regime.upper())
+    asset_classes = args.asset_classes if args.asset_classes else constants.ASSET_CLASS_LIST.get(regime)
 
     # Add Collateral in asset class list for specific regimes (ASIC, MAS, JFSA)
     if ((not args.asset_classes) and
-            (Config().regime.upper() in [constants.JFSA, constants.ASIC, constants.MAS]) and
+            (regime in [constants.JFSA, constants.ASIC, constants.MAS]) and
             (constants.COLLATERAL not in asset_classes)):
         asset_classes.append(constants.COLLATERAL)
 
@@ -407,14 +527,14 @@ def main():
 
     # Get TSR file paths
     tsr_filepaths = filepath_config.get_tsr_files_for_regime(
-        regime=Config().regime.upper(),
+        regime=regime,
         asset_classes=asset_classes
     )
     logger.info(f"TSR File Paths: {tsr_filepaths}")
 
     # Read and prepare GLEIF data
     logger.info('Reading GLEIF file.')
-    gleif_filepath = get_ref_data_location(Config().env.lower()).get('GLEIF')
+    gleif_filepath = get_ref_data_location(env).get('GLEIF')
     df_gleif = read_datasets(
         report_type='gleif',
         filepath_list=gleif_filepath,
@@ -436,32 +556,54 @@ def main():
     successful_asset_classes = []
     failed_asset_classes = []
 
-    # Process each asset class
-    for asset_class in asset_classes:
-        try:
-            df_merged = process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config, args.update_columns)
-
-            # Log matching status summary for this asset class
-            if df_merged is not None and not df_merged.empty:
-                logger.info(f'Creating Report Date column in final output...')
-                report_date = df_merged['report_date'].iloc[0]
-                if asset_class not in [constants.COLLATERAL]:
-                    logger.info(f'Creating Matching Summary Report...')
-                    log_matching_status_summary(report_date, asset_class, df_merged, summary_dict)
-
-                # If the processing succeeds, append to successful asset classes
-                successful_asset_classes.append(asset_class)
-            else:
-                logger.warning(f"No data processed for {asset_class}")
-                failed_asset_classes.append(asset_class)  # Append to failed if no data processed
-
-        except Exception as ex:
-            logger.error(f'Error occurred while processing {Config().regime.upper()}-{asset_class}: {ex}')
-            logger.error(traceback.format_exc())
-            # Append to failed asset classes if an exception occurs
-            failed_asset_classes.append(asset_class)
+    # Asset classes are independent, so they can be processed in worker processes; each worker holds
+    # a full asset class in memory, so more workers need proportionally more RAM
+    max_workers = min(args.max_workers, len(asset_classes))
+    process_one = functools.partial(process_and_summarize_asset_class, tsr_filepaths=tsr_filepaths,
+                                    update_columns_flag=args.update_columns, output_format=args.output_format)
+    executor = None
+    if max_workers > 1:
+        logger.info(f'Processing asset classes in {max_workers} worker processes')
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                                       initargs=(args.env, args.regime, args.run_date, gleif_dict))
+        get_results = [executor.submit(process_one, asset_class).result for asset_class in asset_classes]
+    else:
+        get_results = [functools.partial(process_one, asset_class, gleif_dict=gleif_dict,
+                                         filepath_config=filepath_config)
+                       for asset_class in asset_classes]
 
-        logger.info('----------------------------------------------------')
+    # Process each asset class, collecting the results in order
+    try:
+        for position, (asset_class, get_result) in enumerate(zip(asset_classes, get_results)):
+            # When running sequentially, start reading the next asset class's TSR files from disk meanwhile
+            if executor is None and position + 1 < len(asset_classes):
+                prefetch_tsr_files(tsr_filepaths, asset_classes[position + 1])
+
+            try:
+                result = get_result()
+
+                # Log matching status summary for this asset class
+                if result is not None:
+                    _, matching_summary = result
+                    if matching_summary is not None:
+                        summary_dict[asset_class] = matching_summary
+
+                    # If the processing succeeds, append to successful asset classes
+                    successful_asset_classes.append(asset_class)
+                else:
+                    logger.warning(f"No data processed for {asset_class}")
+                    failed_asset_classes.append(asset_class)  # Append to failed if no data processed
+
+            except Exception as ex:
+                logger.error(f'Error occurred while processing {regime}-{asset_class}: {ex}')
+                logger.error(traceback.format_exc())
+                # Append to failed asset classes if an exception occurs
+                failed_asset_classes.append(asset_class)
+
+            logger.info('----------------------------------------------------')
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     del gleif_dict  # Free up memory
 
@@ -495,6 +637,10 @@ if __name__ == "__main__":
     parser.add_argument('-a', '--asset_classes', nargs='+', help='List of asset classes to process')
     parser.add_argument('-u', '--update_columns', action='store_true', help='Flag to update columns in the saved JSON file')
     parser.add_argument('-g', '--generate_model_config', action='store_true', help='Flag to generate model configuration')
+    parser.add_argument('-f', '--output_format', default='csv', help='Output file format',
+                        choices=list(PANDQDataProcessor.OUTPUT_FORMATS))
+    parser.add_argument('-w', '--max_workers', default=1, type=int,
+                        help='Number of asset classes processed in parallel; each worker needs memory for a full asset class')
 
     args = parser.parse_args()
 
@@ -509,7 +655,8 @@ if __name__ == "__main__":
 
     logger.info('*********************Execution Started*********************')
     logger.info(f'Command line arguments: ENV={args.env}, REGIME={args.regime}, RUN_DATE={args.run_date}, '
-                f'UPDATE_COLUMNS={args.update_columns}, ASSET_CLASSES={args.asset_classes}')
+                f'UPDATE_COLUMNS={args.update_columns}, ASSET_CLASSES={args.asset_classes}, '
+                f'OUTPUT_FORMAT={args.output_format}, MAX_WORKERS={args.max_workers}')
 
     try:
         logger.info(f'Starting execution: main()')
@@ -1,11 +1,43 @@
+import os
 import re
 
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; save_data then writes with DataFrame.to_csv
+    pa = None
+
+# Characters replaced with '_' in the data: carriage returns, newlines and pipes. Each character is replaced
+# on its own, so '\r\n' becomes '__'.
+UNDERSCORE_CHARS_PATTERN = re.compile(r'[\r\n|]')
+
+# Characters removed from the data: double quotes and commas
+REMOVED_CHARS_PATTERN = re.compile(r'[",]')
+
+# Characters replaced with '_' in column names, and runs of underscores collapsed to one
+COLUMN_NAME_UNWANTED_PATTERN = re.compile(r'[^0-9a-zA-Z_]')
+COLUMN_NAME_UNDERSCORES_PATTERN = re.compile(r'_+')
+
+
 class PANDQDataProcessor:
-    def __init__(self, output_filepath=None, data=None):
+    # Supported output formats and their file extensions
+    OUTPUT_FORMATS = {'csv': '.csv', 'parquet': '.parquet'}
+
+    def __init__(self, output_filepath=None, data=None, output_format='csv'):
         """
         Initialize the Processor with a file path or DataFrame.
+        output_format is 'csv' (default) or 'parquet'; for Parquet the output file path's extension
+        is replaced with '.parquet', and pyarrow must be installed.
         """
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format: {output_format}. Must be one of {list(self.OUTPUT_FORMATS)}.")
+
+        if output_filepath and output_format != 'csv':
+            output_filepath = os.path.splitext(output_filepath)[0] + self.OUTPUT_FORMATS[output_format]
         self.output_filepath = output_filepath
+        self.output_format = output_format
         self.data = data
 
     def clean_data(self):
@@ -21,49 +53,85 @@ class PANDQDataProcessor:
         """
         try:
             # Convert all float64 columns to object type to avoid FutureWarning when filling NaN with strings
-            self.data = self.data.astype({col: 'object' for col in self.data.select_dtypes(include=['float64']).columns})
+            float_columns = self.data.select_dtypes(include=['float64']).columns
+            self.data = self.data.astype({col: 'object' for col in float_columns})
+
+            # Categorical columns (e.g. 'matching_flag', the identifier prefixes) can't be filled with a value
+            # outside their categories, so they are turned back into plain string columns first
+            categorical_columns = self.data.select_dtypes(include=['category']).columns
+            self.data = self.data.astype({col: 'object' for col in categorical_columns})
 
             # Replace NaN values with empty strings
-            self.data.fillna('', inplace=True)
+            self.data = self.data.fillna('')
 
             # Replace occurrences of '?' with empty strings
-            self.data.replace('?', '', inplace=True)
-
-            # Remove specific unwanted characters
-            self.data.replace({
-                r'\r': '_',     # Replace carriage return characters ('\r') with an underscore ('_')
-                r'\n': '_',     # Replace newline characters ('\n') with an underscore ('_')
-                r'\r\n': '_',   # Replace carriage return + newline sequence ('\r\n') with an underscore ('_')
-                r'"': '',       # Remove double quote characters ('"') completely (replace with an empty string)
-                r'\|': '_',     # Replace pipe characters ('|') with an underscore ('_')
-                r',': ''        # Remove commas (',') completely (replace with an empty string)
-            }, regex=True, inplace=True)
-
-            # Convert all data values to strings
-            self.data = self.data.astype(str)
-
-            # Clean and standardize column names
+            self.data = self.data.replace('?', '')
+
+            # Remove specific unwanted characters: two regex passes over the string cells instead of one per character
+            self.data = self.data.replace({
+                UNDERSCORE_CHARS_PATTERN: '_',  # Replace '\r', '\n' and '|' with an underscore ('_')
+                REMOVED_CHARS_PATTERN: ''       # Remove double quotes ('"') and commas (',') completely
+            }, regex=True)
+
+            # Convert all data values to strings. Object columns read with dtype=str already hold only strings
+            # once NaNs are filled with '', so they are skipped; other object columns (the converted float
+            # columns, or e.g. ints mixed with '' from the merge's unmatched rows) are converted
+            columns_to_convert = [col for col, dtype in self.data.dtypes.items()
+                                  if dtype != object or col in float_columns
+                                  or pd.api.types.infer_dtype(self.data[col], skipna=False) != 'string']
+            if columns_to_convert:
+                self.data = self.data.astype({col: str for col in columns_to_convert})
+
+            # Clean and standardize column names in one pass: replace unwanted characters with underscores,
+            # collapse multiple underscores into one and remove the trailing underscore if present
             self.data.columns = [
-                re.sub(r'[^0-9a-zA-Z_]', '_', col.strip().lower())  # Replace unwanted characters with underscores
+                COLUMN_NAME_UNDERSCORES_PATTERN.sub('_', COLUMN_NAME_UNWANTED_PATTERN.sub('_', col.strip().lower())).rstrip('_')
                 for col in self.data.columns
             ]
 
-            # Replace multiple underscores with a single underscore in column names
-            self.data.columns = [re.sub(r'_+', '_', col) for col in self.data.columns]
-
-            # Remove trailing underscores from each column name if present
-            self.data.columns = [col[:-1] if col.endswith('_') else col for col in self.data.columns]
-
         except Exception as e:
             print(f"Error during data cleaning: {e}")
             raise
 
     def save_data(self, separator):
         """
-        Save the processed DataFrame to a CSV file.
+        Save the processed DataFrame in the configured output format. The separator only applies to CSV.
+        CSV files are written by pyarrow's CSV writer when it is available, falling back to DataFrame.to_csv.
         """
         try:
+            if self.output_format == 'parquet':
+                # Dictionary encoding stores the many repeated strings (flags, LEIs, ...) once per column chunk
+                self.data.to_parquet(self.output_filepath, engine='pyarrow', compression='zstd', index=False,
+                                     use_dictionary=True)
+                return
+            if self._write_csv_with_arrow(separator):
+                return
             self.data.to_csv(self.output_filepath, sep=separator, index=False)
         except Exception as e:
             print(f"Error saving data to {self.output_filepath}: {e}")
             raise
+
+    def _write_csv_with_arrow(self, separator):
+        """
+        Write the DataFrame with pyarrow's CSV writer, which encodes the columns in C rather than formatting
+        each cell in Python. clean_data leaves no quotes, commas, pipes or line breaks in the values, so
+        nothing needs quoting and the file matches to_csv's output; a value that would still need quoting
+        makes pyarrow fail, and the caller then writes with to_csv instead. pyarrow quotes the header even
+        with quoting_style='none', so the header line is written here and only the rows by pyarrow.
+
+        Returns:
+            bool: Whether the file was written.
+        """
+        # pyarrow always ends lines with '\n' while to_csv uses os.linesep, so on Windows to_csv is kept
+        if pa is None or os.linesep != '\n':
+            return False
+        try:
+            table = pa.Table.from_pandas(self.data, preserve_index=False)
+            with open(self.output_filepath, 'wb') as output_file:
+                output_file.write((separator.join(map(str, self.data.columns)) + '\n').encode('utf-8'))
+                pa_csv.write_csv(table, output_file,
+                                 write_options=pa_csv.WriteOptions(include_header=False, delimiter=separator,
+                                                                   quoting_style='none'))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False
+        return True
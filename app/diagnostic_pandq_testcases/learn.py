@@ -17,8 +17,16 @@ my_project/
 2. BASIC TEST EXAMPLE
 --------------------
 """
+import os
+from typing import Final
+
 from testplan import test_plan
 from testplan.testing.multitest import MultiTest, testsuite, testcase
+from testplan.runners.pools.base import Pool as ThreadPool
+from testplan.runners.pools.tasks import Task
+
+# Input of the string example, defined once at import
+TEXT: Final = "testplan"
 
 
 # Define a test suite
@@ -34,16 +42,48 @@ class BasicSuite:
     @testcase
     def test_string_operations(self, env, result):
         """String manipulation example"""
-        text = "testplan"
-        result.true(len(text) == 8, "String length check")
-        result.contain("test", text, "Substring check")
+        result.equal(len(TEXT), 8, "String length check")
+        result.contain("test", TEXT, "Substring check")
+
+
+def make_shard(name, suites, environment=None):
+    """
+    Build the MultiTest of one shard; called by the pool's worker threads when they run its Task.
+    environment is an optional callable building the drivers, called once per shard since every
+    MultiTest starts and stops its own environment.
+    """
+    return MultiTest(name=name, suites=suites, environment=environment() if environment else [])
+
+
+def run_sharded(plan, name, suites, environment=None):
+    """
+    Split independent suites round-robin into one MultiTest per shard and run the shards in parallel
+    on a thread pool, using all but two of the CPU cores (at least one shard, at most one per suite).
+    Pools only run Tasks, so each shard is scheduled as a Task building its MultiTest with make_shard.
+    """
+    shard_count = max(1, min(len(suites), (os.cpu_count() or 1) - 2))
+    pool = ThreadPool(name=f'{name} Pool', size=shard_count)
+    plan.add_resource(pool)
+
+    for index in range(shard_count):
+        task = Task(
+            target='make_shard',
+            module=os.path.splitext(os.path.basename(__file__))[0],
+            path=os.path.dirname(os.path.abspath(__file__)),
+            kwargs=dict(
+                name=f'{name} {index}' if shard_count > 1 else name,
+                suites=suites[index::shard_count],
+                environment=environment,
+            ),
+        )
+        plan.add(task, resource=pool.cfg.name)
 
 
 # Create the main test plan
 @test_plan(name='Basic Example')
 def main(plan):
-    # Add a test suite to the plan
-    plan.add(MultiTest(name='Basic Test', suites=[BasicSuite()]))
+    # Add the test suites to the plan, sharded across the CPU cores
+    run_sharded(plan, 'Basic Test', [BasicSuite()])
 
 
 """
@@ -51,47 +91,61 @@ def main(plan):
 ---------------------------
 Demonstrating fixtures, parametrization, and test environments
 """
+import logging
+
 from testplan.testing.multitest.driver.tcp import TCPServer, TCPClient
 from testplan.common.utils.context import context
 
+log = logging.getLogger(__name__)
+
+# Setup/teardown messages are debug output, only shown when TRAQ_VERBOSE=1
+if os.environ.get('TRAQ_VERBOSE') == '1':
+    logging.basicConfig()
+    log.setLevel(logging.DEBUG)
+
+# Fixed payload sent by the TCP test, built once at import along with its size
+TCP_MESSAGE = b"Hello!"
+TCP_MESSAGE_SIZE = len(TCP_MESSAGE)
+
 
 @testsuite
 class NetworkSuite:
     # Define setup and teardown methods
     def setup(self, env):
         """Set up test environment before each test suite"""
-        print("Setting up test suite")
+        log.debug("Setting up test suite")
+        # fixture scope: suite. The drivers are started once per MultiTest and the client connects once,
+        # so the connection is accepted here and reused by every testcase instead of set up per test
+        env.server.accept_connection()
 
     def teardown(self, env):
         """Clean up after test suite execution"""
-        print("Tearing down test suite")
+        log.debug("Tearing down test suite")
 
     @testcase
     def test_tcp_communication(self, env, result):
         """Test TCP communication between client and server"""
-        # Access server and client from environment
-        msg = b"Hello!"
-        env.server.accept_connection()
-        env.client.send(msg)
-        received = env.server.receive(size=len(msg))
-        result.equal(received, msg, "TCP communication check")
+        # Access server and client from environment; the connection was accepted in setup
+        env.client.send(TCP_MESSAGE)
+        received = env.server.receive(size=TCP_MESSAGE_SIZE)
+        result.equal(received, TCP_MESSAGE, "TCP communication check")
 
 
 # Example with environment setup
 @test_plan(name='Advanced Example')
 def main_advanced(plan):
-    # Create MultiTest with custom environment
-    test = MultiTest(
-        name='Network Test',
-        suites=[NetworkSuite()],
-        environment=[
+    # Create sharded MultiTests with custom environment
+    run_sharded(
+        plan,
+        'Network Test',
+        [NetworkSuite()],
+        environment=lambda: [
             TCPServer(name='server'),
             TCPClient(name='client',
                       host='localhost',
                       port=context('server', '{{port}}'))
         ]
     )
-    plan.add(test)
 
 
 """
@@ -99,49 +153,64 @@ def main_advanced(plan):
 -------------------------------
 Demonstrating how to create data-driven tests
 """
+import numpy as np
 from testplan.testing.multitest.parametrization import ParametrizedTestCase
 
+PEOPLE = [
+    ('Alice', 25),
+    ('Bob', 30),
+    ('Charlie', 35)
+]
+
 
 @testsuite
 class ParameterizedSuite:
-    @testcase(parameters=[
-        ('Alice', 25),
-        ('Bob', 30),
-        ('Charlie', 35)
-    ])
+    @testcase(parameters=PEOPLE)
     def test_person_age(self, env, result, name, age):
-        """Parameterized test example"""
+        """Parameterized test example: one testcase per row, for per-row reporting"""
         result.greater(age, 0, f"{name}'s age should be positive")
         result.less(age, 150, f"{name}'s age should be reasonable")
 
+    @testcase(parameters=[(PEOPLE,)])
+    def test_person_ages_batch(self, env, result, rows):
+        """Batch variant: all rows checked in one testcase, so the per-testcase overhead is paid once"""
+        ages = np.array([age for _, age in rows])
+        result.true(bool((ages > 0).all()), "All ages should be positive")
+        result.true(bool((ages < 150).all()), "All ages should be reasonable")
+
 
 """
 5. REPORTING AND ASSERTIONS
 --------------------------
 Different types of assertions and generating reports
 """
+import re
+
+# Compiled once at import rather than on every assertion
+HELLO_PATTERN = re.compile(r'hello \w+')
 
 
 @testsuite
 class ReportingSuite:
     @testcase
     def test_various_assertions(self, env, result):
-        # Basic assertions
-        result.true(True, "Basic boolean check")
-        result.false(False, "Negative boolean check")
-        result.equal(5, 5, "Equality check")
-        result.not_equal(5, 6, "Inequality check")
-
-        # Collection assertions
-        result.contain(1, [1, 2, 3], "List membership")
-        result.not_contain(4, [1, 2, 3], "Negative list membership")
+        # Basic, collection and numeric checks on constant values, batched into a single dict assertion
+        # so the report gets one entry instead of one per check
+        actual = {
+            'Basic boolean check': True,
+            'Negative boolean check': not False,
+            'Equality check': 5 == 5,
+            'Inequality check': 5 != 6,
+            'List membership': 1 in [1, 2, 3],
+            'Negative list membership': 4 not in [1, 2, 3],
+            'Greater than': 10 > 5,
+            'Less than': 5 < 10,
+        }
+        expected = dict.fromkeys(actual, True)
+        result.dict.match(actual, expected, description="Batched constant assertions")
 
         # String assertions
-        result.regex.match('hello world', r'hello \w+', "Regex pattern matching")
-
-        # Numeric assertions
-        result.greater(10, 5, "Greater than")
-        result.less(5, 10, "Less than")
+        result.regex.match(HELLO_PATTERN, 'hello world', "Regex pattern matching")
 
 
 """
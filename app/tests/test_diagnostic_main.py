@@ -0,0 +1,54 @@
+import argparse
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import diagnostic_main
+from common import constants
+from common.config.args_config import Config
+from common.config.filepath_config import FilePathConfig
+
+
+def fake_process_asset_class(asset_class, tsr_filepaths, gleif_dict, filepath_config, update_columns_flag,
+                             output_format='csv'):
+    """
+    Stands in for the full read -> merge -> PANDQ pipeline, checking what a worker receives.
+    """
+    assert isinstance(filepath_config, FilePathConfig)
+    assert gleif_dict.get('LEI1') == 'Entity 1'
+    return pd.DataFrame({'report_date': ['2024-01-02'] * 2, 'matching_flag': ['both', 'unmatched']})
+
+
+def test_main_runs_asset_classes_in_two_workers(monkeypatch):
+    """
+    -w 2 processes the asset classes in worker processes and collects each one's summary.
+    """
+    asset_classes = [constants.CREDIT, constants.INTEREST_RATES]
+    Config(env='qa', regime=constants.ASIC.lower(), run_date='2024-01-02')
+
+    # Fork the workers so that they inherit the stubs below
+    monkeypatch.setattr(diagnostic_main, 'ProcessPoolExecutor',
+                        functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context('fork')))
+    monkeypatch.setattr(diagnostic_main, 'process_asset_class', fake_process_asset_class)
+    monkeypatch.setattr(diagnostic_main, 'get_logger', lambda *args, **kwargs: logging.getLogger('test'))
+    monkeypatch.setattr(diagnostic_main, 'get_output_location', lambda env: {})
+    monkeypatch.setattr(diagnostic_main, 'get_ref_data_location', lambda env: {})
+    monkeypatch.setattr(diagnostic_main, 'read_datasets',
+                        lambda **kwargs: pd.DataFrame({'LEI': ['LEI1'], 'Entity Name': ['Entity 1']}))
+    monkeypatch.setattr(diagnostic_main, 'logger', logging.getLogger('test'), raising=False)
+    monkeypatch.setattr(diagnostic_main, 'args', argparse.Namespace(
+        env='qa', regime=constants.ASIC.lower(), run_date='2024-01-02', asset_classes=asset_classes,
+        update_columns=False, generate_model_config=False, output_format='csv', max_workers=2
+    ), raising=False)
+
+    summaries = []
+    monkeypatch.setattr(diagnostic_main, 'print_matching_status_summary', summaries.append)
+
+    diagnostic_main.main()
+
+    assert list(summaries[0]) == asset_classes
+    for summary in summaries[0].values():
+        assert summary['status_counts'].to_dict() == {'both': 1, 'unmatched': 1}